@@ -0,0 +1,6 @@
+-- Migration: Server-side default for scrape_jobs.started_at
+-- Description: Job start timestamps are now assigned by the database clock
+-- instead of being computed in Python and sent with every INSERT
+
+ALTER TABLE scrape_jobs
+ALTER COLUMN started_at SET DEFAULT now();
@@ -0,0 +1,12 @@
+-- Migration: Add indexes for latest-job lookups
+-- Description: Lets get_latest() resolve as an index seek + LIMIT 1
+-- instead of a sequential scan and sort over scrape_jobs
+
+CREATE INDEX IF NOT EXISTS ix_scrape_jobs_type_started
+ON scrape_jobs (job_type, started_at DESC);
+
+CREATE INDEX IF NOT EXISTS ix_scrape_jobs_started
+ON scrape_jobs (started_at DESC);
+
+-- Verify with:
+-- EXPLAIN SELECT * FROM scrape_jobs WHERE job_type = 'FULL' ORDER BY started_at DESC LIMIT 1;
@@ -0,0 +1,16 @@
+-- Migration: Add url_hash lookup column to scraped_urls
+-- Description: URL lookups seek on an indexed 8-byte hash (first 8 bytes of
+-- md5(url) as a signed BIGINT) and confirm on the url string
+
+ALTER TABLE scraped_urls
+ADD COLUMN IF NOT EXISTS url_hash BIGINT;
+
+-- Backfill existing rows (must match src.database.models.hash_url)
+UPDATE scraped_urls
+SET url_hash = ('x' || substr(md5(url), 1, 16))::bit(64)::bigint
+WHERE url_hash IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_scraped_urls_url_hash
+ON scraped_urls (url_hash);
+
+COMMENT ON COLUMN scraped_urls.url_hash IS 'Signed 64-bit prefix of md5(url) for fast lookups';
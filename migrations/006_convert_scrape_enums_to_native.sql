@@ -0,0 +1,42 @@
+-- Migration: Store scrape job/URL enums as native PostgreSQL ENUM types
+-- Description: Tables created by SQLAlchemy's create_all already use these
+-- types. This converts any VARCHAR-typed columns (e.g. tables created by hand)
+-- so every deployment gets compact 4-byte enum storage and smaller indexes.
+-- Labels are the Python enum member names, matching SQLAlchemy's Enum mapping.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'jobtype') THEN
+        CREATE TYPE jobtype AS ENUM ('FULL', 'ANIMALS_ONLY', 'CONTENT_ONLY', 'INCREMENTAL');
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'jobstatus') THEN
+        CREATE TYPE jobstatus AS ENUM ('PENDING', 'RUNNING', 'COMPLETED', 'FAILED');
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'urltype') THEN
+        CREATE TYPE urltype AS ENUM ('ANIMAL', 'ADOPTION_LIST', 'GENERAL', 'SERVICE', 'TIPS', 'IGNORED');
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'scrapestatus') THEN
+        CREATE TYPE scrapestatus AS ENUM ('PENDING', 'SUCCESS', 'FAILED');
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_name = 'scrape_jobs' AND column_name = 'job_type'
+                 AND data_type = 'character varying') THEN
+        ALTER TABLE scrape_jobs ALTER COLUMN job_type TYPE jobtype USING job_type::jobtype;
+    END IF;
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_name = 'scrape_jobs' AND column_name = 'status'
+                 AND data_type = 'character varying') THEN
+        ALTER TABLE scrape_jobs ALTER COLUMN status TYPE jobstatus USING status::jobstatus;
+    END IF;
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_name = 'scraped_urls' AND column_name = 'url_type'
+                 AND data_type = 'character varying') THEN
+        ALTER TABLE scraped_urls ALTER COLUMN url_type TYPE urltype USING url_type::urltype;
+    END IF;
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_name = 'scraped_urls' AND column_name = 'scrape_status'
+                 AND data_type = 'character varying') THEN
+        ALTER TABLE scraped_urls ALTER COLUMN scrape_status TYPE scrapestatus USING scrape_status::scrapestatus;
+    END IF;
+END $$;
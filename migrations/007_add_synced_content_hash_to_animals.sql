@@ -0,0 +1,6 @@
+-- Migration: Track the hash of each animal's uploaded File Search document
+-- Description: Lets the sync skip re-uploading animals whose rendered
+-- document is unchanged since the last successful sync. Existing rows start
+-- as NULL and are filled in on their next upload.
+
+ALTER TABLE animals ADD COLUMN IF NOT EXISTS synced_content_hash VARCHAR(64);
@@ -72,17 +72,18 @@ async def trigger_scrape(request: ScrapeJobRequest) -> ScrapeJobResponse:
     )
 
     try:
-        if request.job_type == "animals":
-            result = await orchestrator.run_animal_scrape()
-        elif request.job_type == "content":
-            result = await orchestrator.run_content_scrape()
-        elif request.job_type == "full":
-            result = await orchestrator.run_full_scrape()
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid job type: {request.job_type}. Must be 'animals', 'content', or 'full'"
-            )
+        async with orchestrator:
+            if request.job_type == "animals":
+                result = await orchestrator.run_animal_scrape()
+            elif request.job_type == "content":
+                result = await orchestrator.run_content_scrape()
+            elif request.job_type == "full":
+                result = await orchestrator.run_full_scrape()
+            else:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid job type: {request.job_type}. Must be 'animals', 'content', or 'full'"
+                )
 
         return ScrapeJobResponse(**result)
 
@@ -112,6 +113,7 @@ async def trigger_sync(request: SyncRequest) -> SyncResponse:
         api_key=settings.google_api_key,
         content_dir=settings.general_content_dir,
         batch_size=settings.sync_batch_size,
+        max_concurrent=settings.sync_max_concurrent,
     )
 
     try:
@@ -168,9 +170,12 @@ async def retry_failed_urls() -> dict:
     from ...utils.config import get_settings
 
     settings = get_settings()
-    scraper = ContentScraper(content_dir=settings.general_content_dir)
 
-    async with get_session() as session:
+    # The scraper keeps a headless browser open until it is closed
+    async with (
+        ContentScraper(content_dir=settings.general_content_dir) as scraper,
+        get_session() as session,
+    ):
         url_repo = ScrapedURLRepository(session)
 
         # Get failed URLs that can be retried
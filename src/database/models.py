@@ -1,9 +1,11 @@
 """SQLAlchemy async models for SPCA AI Assistant."""
 
+import hashlib
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     Enum,
@@ -13,6 +15,7 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSON, JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -65,6 +68,15 @@ class URLType(str, enum.Enum):
     IGNORED = "ignored"
 
 
+def hash_url(url: str) -> int:
+    """Compute a signed 64-bit lookup key for a URL.
+
+    First 8 bytes of the MD5 digest, so existing rows can be backfilled in SQL with
+    ('x' || substr(md5(url), 1, 16))::bit(64)::bigint.
+    """
+    return int.from_bytes(hashlib.md5(url.encode("utf-8")).digest()[:8], "big", signed=True)
+
+
 class Animal(Base):
     """Model for animal data."""
 
@@ -101,6 +113,7 @@ class Animal(Base):
     synced_to_google: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
     google_file_id: Mapped[Optional[str]] = mapped_column(String(100))
     last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    synced_content_hash: Mapped[Optional[str]] = mapped_column(String(64))  # Hash of the uploaded document
 
     __table_args__ = (
         Index("ix_animals_species_status", "species", "status"),
@@ -116,11 +129,18 @@ class ScrapeJob(Base):
     __tablename__ = "scrape_jobs"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    job_type: Mapped[JobType] = mapped_column(Enum(JobType), nullable=False)
+    # Native PostgreSQL ENUM types (4-byte labels instead of VARCHAR)
+    job_type: Mapped[JobType] = mapped_column(
+        Enum(JobType, name="jobtype", native_enum=True), nullable=False
+    )
     status: Mapped[JobStatus] = mapped_column(
-        Enum(JobStatus), default=JobStatus.PENDING, index=True
+        Enum(JobStatus, name="jobstatus", native_enum=True),
+        default=JobStatus.PENDING,
+        index=True,
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
     )
-    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     urls_discovered: Mapped[int] = mapped_column(Integer, default=0)
     urls_scraped: Mapped[int] = mapped_column(Integer, default=0)
@@ -133,6 +153,12 @@ class ScrapeJob(Base):
         "ScrapedURL", back_populates="job", lazy="selectin"
     )
 
+    # Index-driven "latest job" lookups (get_latest): seek + LIMIT 1 instead of scan + sort
+    __table_args__ = (
+        Index("ix_scrape_jobs_type_started", "job_type", text("started_at DESC")),
+        Index("ix_scrape_jobs_started", text("started_at DESC")),
+    )
+
     def __repr__(self) -> str:
         return f"<ScrapeJob(id={self.id}, type='{self.job_type}', status='{self.status}')>"
 
@@ -144,11 +170,16 @@ class ScrapedURL(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     url: Mapped[str] = mapped_column(String(500), unique=True, nullable=False, index=True)
-    url_type: Mapped[URLType] = mapped_column(Enum(URLType), nullable=False, index=True)
+    url_hash: Mapped[Optional[int]] = mapped_column(BigInteger, index=True)
+    url_type: Mapped[URLType] = mapped_column(
+        Enum(URLType, name="urltype", native_enum=True), nullable=False, index=True
+    )
     content_hash: Mapped[Optional[str]] = mapped_column(String(64))
     last_scraped_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     scrape_status: Mapped[ScrapeStatus] = mapped_column(
-        Enum(ScrapeStatus), default=ScrapeStatus.PENDING, index=True
+        Enum(ScrapeStatus, name="scrapestatus", native_enum=True),
+        default=ScrapeStatus.PENDING,
+        index=True,
     )
     retry_count: Mapped[int] = mapped_column(Integer, default=0)
     error_message: Mapped[Optional[str]] = mapped_column(Text)
@@ -174,7 +205,7 @@ class SyncLog(Base):
     entity_id: Mapped[str] = mapped_column(String(500), nullable=False)
     action: Mapped[str] = mapped_column(String(20), nullable=False)  # 'create', 'update', 'delete'
     google_file_id: Mapped[Optional[str]] = mapped_column(String(100))
-    content_hash: Mapped[Optional[str]] = mapped_column(String(64))  # SHA256 hash for change detection
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))  # Content hash for change detection
     synced_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -1,9 +1,9 @@
 """Repository for Animal data access."""
 
 from datetime import datetime
-from typing import Optional, List
+from typing import AsyncIterator, Iterable, Optional, List
 
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, update, delete, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import BaseRepository
@@ -85,6 +85,31 @@ class AnimalRepository(BaseRepository[Animal]):
         )
         return list(result.scalars().all())
 
+    async def iter_unsynced(self, chunk_size: int = 50) -> AsyncIterator[Animal]:
+        """Stream animals not yet synced, without materializing the result set."""
+        result = await self.session.stream_scalars(
+            select(Animal)
+            .where(Animal.synced_to_google == False)  # noqa: E712
+            .where(Animal.status == AnimalStatus.AVAILABLE)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for animal in result:
+            yield animal
+
+    async def iter_modified_synced(self, chunk_size: int = 50) -> AsyncIterator[Animal]:
+        """Stream synced animals that were modified after last sync."""
+        result = await self.session.stream_scalars(
+            select(Animal)
+            .where(Animal.synced_to_google == True)  # noqa: E712
+            .where(Animal.status == AnimalStatus.AVAILABLE)
+            .where(Animal.last_modified_at.isnot(None))
+            .where(Animal.last_synced_at.isnot(None))
+            .where(Animal.last_modified_at > Animal.last_synced_at)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for animal in result:
+            yield animal
+
     async def get_by_status(self, status: AnimalStatus, limit: int = 100) -> List[Animal]:
         """Get animals by status."""
         result = await self.session.execute(
@@ -95,11 +120,25 @@ class AnimalRepository(BaseRepository[Animal]):
         )
         return list(result.scalars().all())
 
+    async def get_synced_by_status(
+        self, status: AnimalStatus, limit: Optional[int] = None
+    ) -> List[Animal]:
+        """Get animals with a status that still have a File Search document."""
+        query = (
+            select(Animal)
+            .where(Animal.status == status)
+            .where(Animal.google_file_id.isnot(None))
+            .order_by(Animal.first_seen_at.desc())
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def create(self, animal: Animal) -> Animal:
         """Create a new animal."""
         self.session.add(animal)
         await self.session.flush()
-        await self.session.refresh(animal)
         return animal
 
     async def update(self, animal: Animal) -> Animal:
@@ -138,7 +177,6 @@ class AnimalRepository(BaseRepository[Animal]):
             animal.last_scraped_at = datetime.utcnow()
             self.session.add(animal)
             await self.session.flush()
-            await self.session.refresh(animal)
             return animal
 
     async def mark_synced(
@@ -155,6 +193,42 @@ class AnimalRepository(BaseRepository[Animal]):
             )
         )
 
+    async def mark_synced_bulk(
+        self, file_ids: dict[int, str], content_hashes: Optional[dict[int, str]] = None
+    ) -> None:
+        """Mark many animals as synced with a single UPDATE.
+
+        file_ids maps animal id to its new google_file_id; content_hashes
+        optionally maps animal id to the hash of the uploaded document.
+        """
+        if not file_ids:
+            return
+        values = dict(
+            synced_to_google=True,
+            google_file_id=case(file_ids, value=Animal.id),
+            last_synced_at=datetime.utcnow(),
+        )
+        if content_hashes:
+            values["synced_content_hash"] = case(
+                content_hashes, value=Animal.id, else_=Animal.synced_content_hash
+            )
+        await self.session.execute(
+            update(Animal)
+            .where(Animal.id.in_(list(file_ids)))
+            .values(**values)
+        )
+
+    async def mark_unsynced_bulk(self, animal_ids: Iterable[int]) -> None:
+        """Clear the File Search sync state of many animals with a single UPDATE."""
+        ids = list(animal_ids)
+        if not ids:
+            return
+        await self.session.execute(
+            update(Animal)
+            .where(Animal.id.in_(ids))
+            .values(synced_to_google=False, google_file_id=None)
+        )
+
     async def mark_adopted(self, reference_number: str) -> Optional[Animal]:
         """Mark an animal as adopted."""
         animal = await self.get_by_reference(reference_number)
@@ -164,6 +238,25 @@ class AnimalRepository(BaseRepository[Animal]):
             await self.session.flush()
         return animal
 
+    async def mark_adopted_except(self, found_refs: Iterable[str]) -> list[str]:
+        """Mark every non-adopted animal not in found_refs as adopted.
+
+        Returns the reference numbers that were changed.
+        """
+        result = await self.session.execute(
+            update(Animal)
+            .where(
+                Animal.status != AnimalStatus.ADOPTED,
+                Animal.reference_number.not_in(list(found_refs)),
+            )
+            .values(
+                status=AnimalStatus.ADOPTED,
+                last_modified_at=datetime.utcnow(),
+            )
+            .returning(Animal.reference_number)
+        )
+        return list(result.scalars().all())
+
     async def get_all_reference_numbers(self) -> set[str]:
         """Get all reference numbers currently in database."""
         result = await self.session.execute(
@@ -1,13 +1,22 @@
 """Repository for Scrape job and URL tracking."""
 
-from datetime import datetime
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, insert, update, delete, func, case
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import BaseRepository
-from ..models import ScrapeJob, ScrapedURL, SyncLog, JobStatus, JobType, ScrapeStatus, URLType
+from ..models import (
+    ScrapeJob,
+    ScrapedURL,
+    SyncLog,
+    JobStatus,
+    JobType,
+    ScrapeStatus,
+    URLType,
+    hash_url,
+)
 
 
 class ScrapeJobRepository(BaseRepository[ScrapeJob]):
@@ -52,7 +61,6 @@ class ScrapeJobRepository(BaseRepository[ScrapeJob]):
         """Create a new job."""
         self.session.add(job)
         await self.session.flush()
-        await self.session.refresh(job)
         return job
 
     async def update(self, job: ScrapeJob) -> ScrapeJob:
@@ -73,11 +81,9 @@ class ScrapeJobRepository(BaseRepository[ScrapeJob]):
         job = ScrapeJob(
             job_type=job_type,
             status=JobStatus.RUNNING,
-            started_at=datetime.utcnow(),
         )
         self.session.add(job)
         await self.session.flush()
-        await self.session.refresh(job)
         return job
 
     async def complete_job(
@@ -93,7 +99,7 @@ class ScrapeJobRepository(BaseRepository[ScrapeJob]):
             .where(ScrapeJob.id == job_id)
             .values(
                 status=JobStatus.COMPLETED,
-                completed_at=datetime.utcnow(),
+                completed_at=func.now(),
                 urls_discovered=urls_discovered,
                 urls_scraped=urls_scraped,
                 urls_failed=urls_failed,
@@ -107,7 +113,7 @@ class ScrapeJobRepository(BaseRepository[ScrapeJob]):
             .where(ScrapeJob.id == job_id)
             .values(
                 status=JobStatus.FAILED,
-                completed_at=datetime.utcnow(),
+                completed_at=func.now(),
                 error_message=error_message,
             )
         )
@@ -127,9 +133,11 @@ class ScrapedURLRepository(BaseRepository[ScrapedURL]):
         return result.scalar_one_or_none()
 
     async def get_by_url(self, url: str) -> Optional[ScrapedURL]:
-        """Get by URL string."""
+        """Get by URL string (8-byte hash seek, confirmed by URL)."""
         result = await self.session.execute(
-            select(ScrapedURL).where(ScrapedURL.url == url)
+            select(ScrapedURL)
+            .where(ScrapedURL.url_hash == hash_url(url))
+            .where(ScrapedURL.url == url)
         )
         return result.scalar_one_or_none()
 
@@ -152,6 +160,18 @@ class ScrapedURLRepository(BaseRepository[ScrapedURL]):
         )
         return list(result.scalars().all())
 
+    async def iter_by_type(
+        self, url_type: URLType, chunk_size: int = 500
+    ) -> AsyncIterator[ScrapedURL]:
+        """Stream URLs by type without materializing the full result set."""
+        result = await self.session.stream_scalars(
+            select(ScrapedURL)
+            .where(ScrapedURL.url_type == url_type)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for scraped_url in result:
+            yield scraped_url
+
     async def get_pending(self, url_type: Optional[URLType] = None, limit: int = 100) -> List[ScrapedURL]:
         """Get pending URLs to scrape."""
         query = select(ScrapedURL).where(ScrapedURL.scrape_status == ScrapeStatus.PENDING)
@@ -170,11 +190,23 @@ class ScrapedURLRepository(BaseRepository[ScrapedURL]):
         )
         return list(result.scalars().all())
 
+    async def iter_failed(
+        self, max_retries: int = 3, chunk_size: int = 500
+    ) -> AsyncIterator[ScrapedURL]:
+        """Stream failed URLs that can be retried."""
+        result = await self.session.stream_scalars(
+            select(ScrapedURL)
+            .where(ScrapedURL.scrape_status == ScrapeStatus.FAILED)
+            .where(ScrapedURL.retry_count < max_retries)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for scraped_url in result:
+            yield scraped_url
+
     async def create(self, scraped_url: ScrapedURL) -> ScrapedURL:
         """Create a new scraped URL record."""
         self.session.add(scraped_url)
         await self.session.flush()
-        await self.session.refresh(scraped_url)
         return scraped_url
 
     async def update(self, scraped_url: ScrapedURL) -> ScrapedURL:
@@ -202,13 +234,13 @@ class ScrapedURLRepository(BaseRepository[ScrapedURL]):
         else:
             scraped_url = ScrapedURL(
                 url=url,
+                url_hash=hash_url(url),
                 url_type=url_type,
                 job_id=job_id,
                 scrape_status=ScrapeStatus.PENDING,
             )
             self.session.add(scraped_url)
             await self.session.flush()
-            await self.session.refresh(scraped_url)
             return scraped_url
 
     async def mark_success(
@@ -217,10 +249,11 @@ class ScrapedURLRepository(BaseRepository[ScrapedURL]):
         """Mark URL as successfully scraped."""
         await self.session.execute(
             update(ScrapedURL)
+            .where(ScrapedURL.url_hash == hash_url(url))
             .where(ScrapedURL.url == url)
             .values(
                 scrape_status=ScrapeStatus.SUCCESS,
-                last_scraped_at=datetime.utcnow(),
+                last_scraped_at=func.now(),
                 content_hash=content_hash,
                 file_path=file_path,
                 error_message=None,
@@ -233,6 +266,7 @@ class ScrapedURLRepository(BaseRepository[ScrapedURL]):
         if scraped:
             await self.session.execute(
                 update(ScrapedURL)
+                .where(ScrapedURL.url_hash == hash_url(url))
                 .where(ScrapedURL.url == url)
                 .values(
                     scrape_status=ScrapeStatus.FAILED,
@@ -241,6 +275,67 @@ class ScrapedURLRepository(BaseRepository[ScrapedURL]):
                 )
             )
 
+    async def record_results(self, rows: list[dict]) -> None:
+        """Bulk upsert scrape outcomes with one INSERT ... ON CONFLICT DO UPDATE.
+
+        Each row holds url, url_type and success, plus content_hash/file_path on
+        success or error_message on failure. Mirrors upsert + mark_success/mark_failed.
+        """
+        if not rows:
+            return
+
+        # One statement cannot touch the same row twice; keep the latest outcome
+        latest = {row["url"]: row for row in rows}
+        values = [
+            {
+                "url": row["url"],
+                "url_hash": hash_url(row["url"]),
+                "url_type": row["url_type"],
+                "scrape_status": ScrapeStatus.SUCCESS if row["success"] else ScrapeStatus.FAILED,
+                "content_hash": row.get("content_hash") if row["success"] else None,
+                "file_path": row.get("file_path") if row["success"] else None,
+                "error_message": None if row["success"] else row.get("error_message"),
+                "last_scraped_at": func.now() if row["success"] else None,
+                "retry_count": 0 if row["success"] else 1,
+            }
+            for row in latest.values()
+        ]
+
+        stmt = pg_insert(ScrapedURL).values(values)
+        excluded = stmt.excluded
+        succeeded = excluded.scrape_status == ScrapeStatus.SUCCESS
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ScrapedURL.url],
+            set_={
+                "url_hash": excluded.url_hash,
+                "url_type": excluded.url_type,
+                "scrape_status": excluded.scrape_status,
+                "error_message": excluded.error_message,
+                "content_hash": case(
+                    (succeeded, excluded.content_hash), else_=ScrapedURL.content_hash
+                ),
+                "file_path": case(
+                    (succeeded, excluded.file_path), else_=ScrapedURL.file_path
+                ),
+                "last_scraped_at": case(
+                    (succeeded, excluded.last_scraped_at), else_=ScrapedURL.last_scraped_at
+                ),
+                "retry_count": case(
+                    (succeeded, ScrapedURL.retry_count), else_=ScrapedURL.retry_count + 1
+                ),
+            },
+        )
+        await self.session.execute(stmt)
+
+
+# Optional log_sync arguments, used to give bulk-inserted rows uniform keys
+_SYNC_LOG_DEFAULTS = {
+    "google_file_id": None,
+    "status": "success",
+    "error_message": None,
+    "content_hash": None,
+}
+
 
 class SyncLogRepository(BaseRepository[SyncLog]):
     """Repository for SyncLog operations."""
@@ -269,7 +364,6 @@ class SyncLogRepository(BaseRepository[SyncLog]):
         """Create a new sync log."""
         self.session.add(log)
         await self.session.flush()
-        await self.session.refresh(log)
         return log
 
     async def update(self, log: SyncLog) -> SyncLog:
@@ -307,9 +401,19 @@ class SyncLogRepository(BaseRepository[SyncLog]):
         )
         self.session.add(log)
         await self.session.flush()
-        await self.session.refresh(log)
         return log
 
+    async def log_sync_many(self, entries: list[dict], batch_size: int = 1000) -> None:
+        """Bulk-insert sync log entries (dicts of log_sync keyword args).
+
+        Rows are padded to the same keys with log_sync's defaults: executemany
+        compiles one statement from the first row, so every row must bind the
+        same columns.
+        """
+        rows = [{**_SYNC_LOG_DEFAULTS, **entry} for entry in entries]
+        for start in range(0, len(rows), batch_size):
+            await self.session.execute(insert(SyncLog), rows[start:start + batch_size])
+
     async def get_by_entity(self, entity_type: str, entity_id: str) -> List[SyncLog]:
         """Get logs for a specific entity."""
         result = await self.session.execute(
@@ -319,3 +423,17 @@ class SyncLogRepository(BaseRepository[SyncLog]):
             .order_by(SyncLog.synced_at.desc())
         )
         return list(result.scalars().all())
+
+    async def get_by_entities(
+        self, entity_type: str, entity_ids: List[str]
+    ) -> List[SyncLog]:
+        """Get logs for many entities of one type, newest first."""
+        if not entity_ids:
+            return []
+        result = await self.session.execute(
+            select(SyncLog)
+            .where(SyncLog.entity_type == entity_type)
+            .where(SyncLog.entity_id.in_(entity_ids))
+            .order_by(SyncLog.synced_at.desc())
+        )
+        return list(result.scalars().all())
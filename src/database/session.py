@@ -1,11 +1,13 @@
 """Database session management for async SQLAlchemy."""
 
+import asyncio
 import os
 import time
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncEngine,
@@ -26,6 +28,11 @@ def get_database_url() -> str:
     )
 
 
+def get_default_pool_size() -> int:
+    """Default pool size: 2x CPU count, but at least 20 for concurrent scrape writes."""
+    return max(20, 2 * (os.cpu_count() or 2))
+
+
 # Lazy initialization
 _engine: Optional[AsyncEngine] = None
 _async_session_factory: Optional[async_sessionmaker] = None
@@ -45,9 +52,13 @@ def get_engine() -> AsyncEngine:
                 _engine = create_async_engine(
                     db_url,
                     echo=os.getenv("DATABASE_ECHO", "false").lower() == "true",
-                    pool_size=int(os.getenv("DATABASE_POOL_SIZE", "5")),
-                    max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "10")),
-                    pool_pre_ping=True,  # Verify connections before using
+                    pool_size=int(
+                        os.getenv("DATABASE_POOL_SIZE", str(get_default_pool_size()))
+                    ),
+                    max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "20")),
+                    # Pool is pre-warmed and recycled, so skip the per-checkout ping RTT
+                    pool_pre_ping=os.getenv("DATABASE_POOL_PRE_PING", "false").lower() == "true",
+                    pool_recycle=int(os.getenv("DATABASE_POOL_RECYCLE", "1800")),
                     connect_args={
                         "server_settings": {"application_name": "spca_assistant"},
                         "timeout": 10,
@@ -80,10 +91,27 @@ def get_session_factory() -> async_sessionmaker:
 
 
 async def init_db() -> None:
-    """Initialize database - create all tables."""
+    """Initialize database - create all tables and pre-warm the pool."""
     engine = get_engine()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await warm_pool()
+
+
+async def warm_pool(size: Optional[int] = None) -> None:
+    """Open pool connections up front so write bursts don't queue on connect."""
+    engine = get_engine()
+    size = size or engine.pool.size()
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(_ping() for _ in range(size)))
+        logger.info(f"Database pool warmed with {size} connections")
+    except Exception as e:
+        logger.warning(f"Failed to warm database pool: {e}")
 
 
 async def drop_db() -> None:
@@ -108,6 +136,25 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def _disable_synchronous_commit(session, transaction, connection) -> None:
+    """Apply synchronous_commit = off to the transaction that just began."""
+    connection.execute(text("SET LOCAL synchronous_commit = off"))
+
+
+@asynccontextmanager
+async def get_bulk_write_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get a session whose transactions commit without waiting for WAL fsync.
+
+    Every transaction begins with SET LOCAL synchronous_commit = off. A server
+    crash can lose the last few hundred milliseconds of commits (never corrupt
+    data), which is fine for idempotent scrape ingestion that the next crawl
+    rebuilds. Do not use for SyncLog or other records that must be durable.
+    """
+    async with get_session() as session:
+        event.listen(session.sync_session, "after_begin", _disable_synchronous_commit)
+        yield session
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for FastAPI to get database session."""
     async with get_session() as session:
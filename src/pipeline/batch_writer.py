@@ -0,0 +1,80 @@
+"""Batched recording of scrape outcomes."""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database.models import URLType
+from ..database.repositories.scrape_repository import ScrapedURLRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWriter:
+    """Accumulate scraped-URL outcomes and write them in bulk.
+
+    Replaces per-URL upsert + mark_success/mark_failed + commit with one
+    INSERT ... ON CONFLICT statement and one commit per batch.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        max_size: int = 100,
+        max_delay: float = 5.0,
+    ):
+        self.session = session
+        self.url_repo = ScrapedURLRepository(session)
+        # Concurrent records can trigger overlapping flushes; the session is not
+        # concurrency-safe
+        self.lock = asyncio.Lock()
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._pending: list[dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+
+    async def record(self, url: str, url_type: URLType, result: dict[str, Any]) -> None:
+        """Queue a scrape outcome, flushing when the batch is full or stale."""
+        success = bool(result.get("success"))
+        self._pending.append({
+            "url": url,
+            "url_type": url_type,
+            "success": success,
+            "content_hash": result.get("content_hash", ""),
+            "file_path": result.get("file_path"),
+            "error_message": None if success else result.get("error", "Unknown error"),
+        })
+
+        if (
+            len(self._pending) >= self.max_size
+            or time.monotonic() - self._last_flush >= self.max_delay
+        ):
+            try:
+                await self.flush()
+            except Exception:
+                # Already logged; the rows stay queued, and the caller's final
+                # flush() raises if the database is still failing
+                pass
+
+    async def flush(self) -> None:
+        """Write all pending outcomes and commit.
+
+        On a database error the session is rolled back, the rows are queued
+        again for the next flush and the error is re-raised.
+        """
+        async with self.lock:
+            rows, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+            if not rows:
+                return
+            try:
+                await self.url_repo.record_results(rows)
+                await self.session.commit()
+            except Exception as e:
+                logger.error(f"Failed to record {len(rows)} scrape results: {e}")
+                await self.session.rollback()
+                self._pending[:0] = rows
+                raise
@@ -1,11 +1,14 @@
 """Event system for pipeline coordination."""
 
 import asyncio
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Coroutine
 
+logger = logging.getLogger(__name__)
+
 
 class EventType(Enum):
     """Types of events in the pipeline."""
@@ -22,7 +25,7 @@ class EventType(Enum):
     SYNC_FAILED = "sync_failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """An event in the pipeline."""
     type: EventType
@@ -36,19 +39,20 @@ class Event:
 # Type alias for event handlers
 EventHandler = Callable[[Event], Coroutine[Any, Any, None]]
 
+# Fixed slot per event type for listener lookup
+_EVENT_INDEX: dict[EventType, int] = {t: i for i, t in enumerate(EventType)}
+
 
 class EventEmitter:
     """Central event bus for pipeline coordination."""
 
     def __init__(self):
-        self._listeners: dict[EventType, list[EventHandler]] = {}
+        self._listeners: list[list[EventHandler]] = [[] for _ in EventType]
         self._global_listeners: list[EventHandler] = []
 
     def on(self, event_type: EventType, handler: EventHandler) -> None:
         """Register a listener for a specific event type."""
-        if event_type not in self._listeners:
-            self._listeners[event_type] = []
-        self._listeners[event_type].append(handler)
+        self._listeners[_EVENT_INDEX[event_type]].append(handler)
 
     def on_any(self, handler: EventHandler) -> None:
         """Register a listener for all events."""
@@ -56,11 +60,10 @@ class EventEmitter:
 
     def off(self, event_type: EventType, handler: EventHandler) -> None:
         """Remove a listener for a specific event type."""
-        if event_type in self._listeners:
-            try:
-                self._listeners[event_type].remove(handler)
-            except ValueError:
-                pass
+        try:
+            self._listeners[_EVENT_INDEX[event_type]].remove(handler)
+        except ValueError:
+            pass
 
     def off_any(self, handler: EventHandler) -> None:
         """Remove a global listener."""
@@ -71,34 +74,40 @@ class EventEmitter:
 
     async def emit(self, event: Event) -> None:
         """Emit an event to all registered listeners."""
-        tasks = []
-
-        # Specific listeners
-        if event.type in self._listeners:
-            for handler in self._listeners[event.type]:
-                tasks.append(asyncio.create_task(self._safe_call(handler, event)))
+        listeners = self._listeners[_EVENT_INDEX[event.type]]
 
-        # Global listeners
-        for handler in self._global_listeners:
-            tasks.append(asyncio.create_task(self._safe_call(handler, event)))
+        # Fast path: nobody is listening
+        if not listeners and not self._global_listeners:
+            return
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        handlers = [*listeners, *self._global_listeners]
 
-    async def _safe_call(self, handler: EventHandler, event: Event) -> None:
-        """Safely call a handler, catching exceptions."""
-        try:
-            await handler(event)
-        except Exception as e:
-            # Log but don't propagate
-            import logging
-            logging.getLogger(__name__).error(
-                f"Error in event handler for {event.type}: {e}"
-            )
+        # Single handler: await directly, no task scheduling needed
+        if len(handlers) == 1:
+            try:
+                await handlers[0](event)
+            except Exception as e:
+                # Log but don't propagate
+                logger.error(f"Error in event handler for {event.type}: {e}")
+            return
+
+        # gather captures handler exceptions; log them in one pass
+        results = await asyncio.gather(
+            *(handler(event) for handler in handlers), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in event handler for {event.type}: {result}")
+
+    async def emit_many(self, events: list[Event]) -> None:
+        """Emit a batch of events in order."""
+        for event in events:
+            await self.emit(event)
 
     def clear(self) -> None:
         """Clear all listeners."""
-        self._listeners.clear()
+        for listeners in self._listeners:
+            listeners.clear()
         self._global_listeners.clear()
 
 
@@ -119,3 +128,55 @@ async def emit_event(event_type: EventType, data: dict[str, Any] | None = None)
     emitter = get_event_emitter()
     event = Event(type=event_type, data=data or {})
     await emitter.emit(event)
+
+
+class EventPublisher:
+    """Queue events and deliver them in batches from one background task.
+
+    Lets hot loops hand events off without awaiting listener execution.
+    Events are delivered in the order they were published.
+    """
+
+    def __init__(self, emitter: EventEmitter | None = None, max_batch: int = 100):
+        self._emitter = emitter
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue[Event] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    def publish(self, event_type: EventType, data: dict[str, Any] | None = None) -> None:
+        """Queue an event for delivery; never blocks."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+        self._queue.put_nowait(Event(type=event_type, data=data or {}))
+
+    async def _drain(self) -> None:
+        emitter = self._emitter or get_event_emitter()
+        while True:
+            # Wait for one event, then take whatever else is already queued
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await emitter.emit_many(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every published event has been delivered."""
+        await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Deliver pending events and stop the background task."""
+        if self._task is None:
+            return
+        # A task that was already cancelled (e.g. on shutdown) can't drain the queue
+        if not self._task.done():
+            await self.flush()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
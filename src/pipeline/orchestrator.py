@@ -2,10 +2,13 @@
 
 import asyncio
 import logging
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Optional
 
-from ..database.session import get_session
+import httpx
+
+from ..database.session import get_bulk_write_session
 from ..database.repositories.animal_repository import AnimalRepository
 from ..database.repositories.scrape_repository import (
     ScrapeJobRepository,
@@ -13,13 +16,27 @@ from ..database.repositories.scrape_repository import (
 )
 from ..database.models import Animal, JobType, URLType
 from ..scrapers.animal_scraper import AnimalScraper
+from ..scrapers.base import AdaptiveSemaphore
 from ..scrapers.content_scraper import ContentScraper
 from ..scrapers.sitemap_crawler import SitemapCrawler
 from ..scrapers.url_categorizer import URLCategorizer
-from .events import EventType, emit_event
+from .batch_writer import BatchWriter
+from .events import EventPublisher, EventType, emit_event
 
 logger = logging.getLogger(__name__)
 
+# URL types scraped as general content, in priority order for de-duplication
+CONTENT_URL_TYPES = (URLType.GENERAL, URLType.SERVICE, URLType.TIPS)
+
+
+@dataclass(slots=True)
+class ScrapeStats:
+    """Counters for a scrape phase."""
+    discovered: int = 0
+    scraped: int = 0
+    failed: int = 0
+    adopted: int = 0
+
 
 class PipelineOrchestrator:
     """Orchestrates the scraping pipeline."""
@@ -29,41 +46,90 @@ class PipelineOrchestrator:
         zyte_api_key: Optional[str] = None,
         use_zyte: bool = True,
         content_dir: str = "./content/general",
+        animal_concurrency: int = 32,
+        content_concurrency: int = 16,
+        retry_timeout: float = 60.0,
+        retry_budget: float = 600.0,
     ):
+        self.animal_concurrency = animal_concurrency
+        self.content_concurrency = content_concurrency
+        self.retry_timeout = retry_timeout
+        self.retry_budget = retry_budget
+        # One pooled client for the orchestrator's lifetime so keep-alive
+        # connections (and their TLS sessions) are reused across pages; with
+        # HTTP/2 concurrent Zyte extract calls multiplex over one connection
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=64,
+                keepalive_expiry=300,
+            ),
+        )
         self.animal_scraper = AnimalScraper(
             zyte_api_key=zyte_api_key,
             use_zyte=use_zyte,
+            http_client=self._http_client,
         )
         self.content_scraper = ContentScraper(content_dir=content_dir)
         self.sitemap_crawler = SitemapCrawler()
+        # Per-URL events are queued and delivered by a single background task
+        self._events = EventPublisher()
+
+    async def __aenter__(self) -> "PipelineOrchestrator":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Deliver pending events and close the shared HTTP client and browser."""
+        await self._events.aclose()
+        await self.content_scraper.aclose()
+        await self.animal_scraper.aclose()
+        await self._http_client.aclose()
 
     async def run_full_scrape(self) -> dict:
         """Run a complete scrape: sitemap + animals + content."""
         logger.info("Starting full scrape")
 
-        async with get_session() as session:
+        async with get_bulk_write_session() as session:
             job_repo = ScrapeJobRepository(session)
             job = await job_repo.start_job(JobType.FULL)
+            # Commit the job row so a rolled-back result batch can't undo it.
+            # A rollback also expires the job object, so keep its id
+            await session.commit()
+            job_id = job.id
 
-            await emit_event(EventType.SCRAPE_STARTED, {"job_id": job.id, "type": "full"})
+            await emit_event(EventType.SCRAPE_STARTED, {"job_id": job_id, "type": "full"})
 
             try:
-                # Discover URLs from sitemap
-                categorized = self.sitemap_crawler.discover_and_categorize()
+                # Discover URLs from sitemap (blocking, in a worker thread) while
+                # scraping animals, which don't depend on the sitemap. If either
+                # fails the other is cancelled, so nothing still writes through
+                # the session once the failure is recorded below
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        sitemap_task = tg.create_task(
+                            asyncio.to_thread(self.sitemap_crawler.discover_and_categorize)
+                        )
+                        animal_task = tg.create_task(self._scrape_animals(session))
+                except ExceptionGroup as eg:
+                    # Report the underlying failure rather than the group
+                    raise eg.exceptions[0]
+                categorized = sitemap_task.result()
+                animal_results = animal_task.result()
 
                 urls_discovered = sum(len(urls) for urls in categorized.values())
 
-                # Scrape animals
-                animal_results = await self._scrape_animals(session)
-
                 # Scrape content
                 content_results = await self._scrape_content(session, categorized)
 
-                urls_scraped = animal_results["scraped"] + content_results["scraped"]
-                urls_failed = animal_results["failed"] + content_results["failed"]
+                urls_scraped = animal_results.scraped + content_results.scraped
+                urls_failed = animal_results.failed + content_results.failed
 
                 await job_repo.complete_job(
-                    job.id,
+                    job_id,
                     urls_discovered=urls_discovered,
                     urls_scraped=urls_scraped,
                     urls_failed=urls_failed,
@@ -72,7 +138,7 @@ class PipelineOrchestrator:
                 await emit_event(
                     EventType.SCRAPE_COMPLETED,
                     {
-                        "job_id": job.id,
+                        "job_id": job_id,
                         "urls_discovered": urls_discovered,
                         "urls_scraped": urls_scraped,
                         "urls_failed": urls_failed,
@@ -80,10 +146,10 @@ class PipelineOrchestrator:
                 )
 
                 # Trigger sync
-                await emit_event(EventType.SYNC_REQUIRED, {"job_id": job.id})
+                await emit_event(EventType.SYNC_REQUIRED, {"job_id": job_id})
 
                 return {
-                    "job_id": job.id,
+                    "job_id": job_id,
                     "urls_discovered": urls_discovered,
                     "urls_scraped": urls_scraped,
                     "urls_failed": urls_failed,
@@ -92,9 +158,12 @@ class PipelineOrchestrator:
 
             except Exception as e:
                 logger.error(f"Full scrape failed: {e}")
-                await job_repo.fail_job(job.id, str(e))
+                # Discard anything a cancelled phase left half-written; the job
+                # row itself was committed when the job started
+                await session.rollback()
+                await job_repo.fail_job(job_id, str(e))
                 await emit_event(
-                    EventType.SCRAPE_FAILED, {"job_id": job.id, "error": str(e)}
+                    EventType.SCRAPE_FAILED, {"job_id": job_id, "error": str(e)}
                 )
                 raise
 
@@ -102,19 +171,23 @@ class PipelineOrchestrator:
         """Scrape only animal pages."""
         logger.info("Starting animal scrape")
 
-        async with get_session() as session:
+        async with get_bulk_write_session() as session:
             job_repo = ScrapeJobRepository(session)
             job = await job_repo.start_job(JobType.ANIMALS_ONLY)
+            # Commit the job row so a rolled-back result batch can't undo it.
+            # A rollback also expires the job object, so keep its id
+            await session.commit()
+            job_id = job.id
 
             await emit_event(
-                EventType.SCRAPE_STARTED, {"job_id": job.id, "type": "animals"}
+                EventType.SCRAPE_STARTED, {"job_id": job_id, "type": "animals"}
             )
 
             try:
-                results = await self._scrape_animals(session)
+                results = asdict(await self._scrape_animals(session))
 
                 await job_repo.complete_job(
-                    job.id,
+                    job_id,
                     urls_discovered=results["discovered"],
                     urls_scraped=results["scraped"],
                     urls_failed=results["failed"],
@@ -122,18 +195,18 @@ class PipelineOrchestrator:
 
                 await emit_event(
                     EventType.SCRAPE_COMPLETED,
-                    {"job_id": job.id, **results},
+                    {"job_id": job_id, **results},
                 )
 
-                await emit_event(EventType.SYNC_REQUIRED, {"job_id": job.id})
+                await emit_event(EventType.SYNC_REQUIRED, {"job_id": job_id})
 
-                return {"job_id": job.id, "status": "completed", **results}
+                return {"job_id": job_id, "status": "completed", **results}
 
             except Exception as e:
                 logger.error(f"Animal scrape failed: {e}")
-                await job_repo.fail_job(job.id, str(e))
+                await job_repo.fail_job(job_id, str(e))
                 await emit_event(
-                    EventType.SCRAPE_FAILED, {"job_id": job.id, "error": str(e)}
+                    EventType.SCRAPE_FAILED, {"job_id": job_id, "error": str(e)}
                 )
                 raise
 
@@ -141,21 +214,27 @@ class PipelineOrchestrator:
         """Scrape only general content pages."""
         logger.info("Starting content scrape")
 
-        async with get_session() as session:
+        async with get_bulk_write_session() as session:
             job_repo = ScrapeJobRepository(session)
             job = await job_repo.start_job(JobType.CONTENT_ONLY)
+            # Commit the job row so a rolled-back result batch can't undo it.
+            # A rollback also expires the job object, so keep its id
+            await session.commit()
+            job_id = job.id
 
             await emit_event(
-                EventType.SCRAPE_STARTED, {"job_id": job.id, "type": "content"}
+                EventType.SCRAPE_STARTED, {"job_id": job_id, "type": "content"}
             )
 
             try:
-                # Get URLs from sitemap
-                categorized = self.sitemap_crawler.discover_and_categorize()
-                results = await self._scrape_content(session, categorized)
+                # Get URLs from sitemap (blocking, in a worker thread)
+                categorized = await asyncio.to_thread(
+                    self.sitemap_crawler.discover_and_categorize
+                )
+                results = asdict(await self._scrape_content(session, categorized))
 
                 await job_repo.complete_job(
-                    job.id,
+                    job_id,
                     urls_discovered=results["discovered"],
                     urls_scraped=results["scraped"],
                     urls_failed=results["failed"],
@@ -163,172 +242,232 @@ class PipelineOrchestrator:
 
                 await emit_event(
                     EventType.SCRAPE_COMPLETED,
-                    {"job_id": job.id, **results},
+                    {"job_id": job_id, **results},
                 )
 
-                await emit_event(EventType.SYNC_REQUIRED, {"job_id": job.id})
+                await emit_event(EventType.SYNC_REQUIRED, {"job_id": job_id})
 
-                return {"job_id": job.id, "status": "completed", **results}
+                return {"job_id": job_id, "status": "completed", **results}
 
             except Exception as e:
                 logger.error(f"Content scrape failed: {e}")
-                await job_repo.fail_job(job.id, str(e))
+                await job_repo.fail_job(job_id, str(e))
                 await emit_event(
-                    EventType.SCRAPE_FAILED, {"job_id": job.id, "error": str(e)}
+                    EventType.SCRAPE_FAILED, {"job_id": job_id, "error": str(e)}
                 )
                 raise
 
-    async def _scrape_animals(self, session) -> dict:
+    async def _scrape_animals(self, session) -> ScrapeStats:
         """Scrape all animals from adoption pages."""
         animal_repo = AnimalRepository(session)
-        url_repo = ScrapedURLRepository(session)
-
-        discovered = 0
-        scraped = 0
-        failed = 0
+        stats = ScrapeStats()
 
-        # Get current animals to detect adopted ones
-        existing_refs = await animal_repo.get_all_reference_numbers()
         found_refs = set()
 
-        # Scrape from all adoption listing pages
-        for language in ["en"]:  # Start with English only
-            listing_urls = URLCategorizer.get_adoption_urls(language)
+        # Collect pet cards from all adoption listing pages; a pet can appear
+        # on more than one listing, so keep only the first card per URL
+        listing_urls = [
+            listing_url
+            for language in ["en"]  # Start with English only
+            for listing_url in URLCategorizer.get_adoption_urls(language)
+        ]
+        logger.info(f"Scraping {len(listing_urls)} listings with pagination")
+
+        # Listings are independent, so paginate them all concurrently
+        listing_results = await asyncio.gather(
+            *(
+                self.animal_scraper.scrape_listing_with_pagination(listing_url)
+                for listing_url in listing_urls
+            ),
+            return_exceptions=True,
+        )
 
-            for listing_url in listing_urls:
-                logger.info(f"Scraping listing with pagination: {listing_url}")
+        pet_cards = []
+        seen_urls: set[str] = set()
+        for listing_url, cards in zip(listing_urls, listing_results):
+            if isinstance(cards, Exception):
+                logger.error(f"Failed to scrape listing {listing_url}: {cards}")
+                continue
+
+            for card in cards:
+                pet_url = card.get("url")
+                if pet_url and pet_url not in seen_urls:
+                    seen_urls.add(pet_url)
+                    pet_cards.append(card)
+
+        stats.discovered = len(pet_cards)
+
+        # Fetch pet pages concurrently under an AIMD-adapted limit. Each animal
+        # is written through its own short-lived session so concurrent writes
+        # use separate pool connections; URL outcomes are batched on the job session
+        sem = AdaptiveSemaphore(initial=self.animal_concurrency)
+        batch = BatchWriter(session)
+
+        async def _persist_animal(pet_url: str, animal_data: dict, success: bool) -> dict:
+            """Write one scraped animal and its URL outcome."""
+            if not success:
+                await batch.record(pet_url, URLType.ANIMAL, animal_data)
+                return {"scraped": 0, "failed": 1, "ref": None}
+
+            # Save to database (remove non-model fields)
+            db_data = {k: v for k, v in animal_data.items() if k not in ('success', 'error')}
+            ref = animal_data.get("reference_number")
+
+            try:
+                # Commits on exit, rolls back and re-raises on error
+                async with get_bulk_write_session() as task_session:
+                    await AnimalRepository(task_session).upsert(db_data)
+                saved = True
+            except Exception as db_error:
+                logger.warning(f"Failed to save {pet_url}: {db_error}")
+                saved = False
+                animal_data = {"success": False, "error": str(db_error)}
+
+            # Track URL outcome (batched)
+            await batch.record(pet_url, URLType.ANIMAL, animal_data)
+            if not saved:
+                return {"scraped": 0, "failed": 1, "ref": None}
+
+            self._events.publish(
+                EventType.ANIMAL_UPDATED,
+                {"reference": ref, "url": pet_url},
+            )
+            return {"scraped": 1, "failed": 0, "ref": ref}
+
+        async def _process_pet(pet_url: str) -> dict:
+            async with sem:
+                # Never raises; failures come back with success=False
+                animal_data = await self.animal_scraper.scrape_animal_page(pet_url)
+                success = bool(animal_data.get("success"))
+                if success:
+                    sem.record_success()
+                else:
+                    sem.record_failure()
+
+            # The fetch slot is already released, so the next page fetch
+            # overlaps with this pet's DB write
+            return await _persist_animal(pet_url, animal_data, success)
+
+        tasks = [
+            asyncio.create_task(_process_pet(pet_card["url"]))
+            for pet_card in pet_cards
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await batch.flush()
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Unexpected error processing pet: {result}")
+                stats.failed += 1
+                continue
+            stats.scraped += result["scraped"]
+            stats.failed += result["failed"]
+            if result["ref"]:
+                found_refs.add(result["ref"])
+
+        # Mark adopted animals (no longer in listings); the diff against the
+        # table is done in SQL so existing references never leave the database
+        adopted_refs = await animal_repo.mark_adopted_except(found_refs)
+        await session.commit()
 
-                try:
-                    # Scrape all pages until no more pets found
-                    pet_cards = await self.animal_scraper.scrape_listing_with_pagination(listing_url)
-                    discovered += len(pet_cards)
-
-                    for pet_card in pet_cards:
-                        pet_url = pet_card.get("url")
-                        if not pet_url:
-                            continue
-
-                        try:
-                            # Track URL
-                            await url_repo.upsert(pet_url, URLType.ANIMAL)
-
-                            # Scrape individual page
-                            animal_data = await self.animal_scraper.scrape_animal_page(
-                                pet_url
-                            )
-
-                            if animal_data.get("success"):
-                                # Save to database (remove non-model fields)
-                                db_data = {k: v for k, v in animal_data.items() if k not in ('success', 'error')}
-
-                                try:
-                                    await animal_repo.upsert(db_data)
-                                    await session.commit()  # Commit after each animal
-                                    scraped += 1
-
-                                    ref = animal_data.get("reference_number")
-                                    if ref:
-                                        found_refs.add(ref)
-
-                                    await url_repo.mark_success(
-                                        pet_url,
-                                        animal_data.get("content_hash", ""),
-                                    )
-
-                                    await emit_event(
-                                        EventType.ANIMAL_UPDATED,
-                                        {"reference": ref, "url": pet_url},
-                                    )
-                                except Exception as db_error:
-                                    logger.warning(f"Failed to save {pet_url}: {db_error}")
-                                    await session.rollback()  # Rollback failed save
-                                    failed += 1
-                            else:
-                                failed += 1
-                                await url_repo.mark_failed(
-                                    pet_url, animal_data.get("error", "Unknown error")
-                                )
-
-                        except Exception as e:
-                            logger.error(f"Failed to scrape {pet_url}: {e}")
-                            failed += 1
-                            await url_repo.mark_failed(pet_url, str(e))
-
-                except Exception as e:
-                    logger.error(f"Failed to scrape listing {listing_url}: {e}")
-
-        # Mark adopted animals (no longer in listings)
-        adopted_refs = existing_refs - found_refs
         for ref in adopted_refs:
-            await animal_repo.mark_adopted(ref)
-            await emit_event(EventType.ANIMAL_ADOPTED, {"reference": ref})
+            self._events.publish(EventType.ANIMAL_ADOPTED, {"reference": ref})
             logger.info(f"Marked animal {ref} as adopted")
 
-        await session.commit()
+        # Job-level events go out after this phase's per-animal events
+        await self._events.flush()
 
-        return {
-            "discovered": discovered,
-            "scraped": scraped,
-            "failed": failed,
-            "adopted": len(adopted_refs),
-        }
+        stats.adopted = len(adopted_refs)
+        return stats
 
-    async def _scrape_content(self, session, categorized: dict) -> dict:
+    async def _scrape_content(self, session, categorized: dict) -> ScrapeStats:
         """Scrape general content pages with smart retry mechanism."""
         url_repo = ScrapedURLRepository(session)
 
-        discovered = 0
-        scraped = 0
-        failed = 0
-
-        # Get content URLs (general, service, tips)
-        content_types = [URLType.GENERAL, URLType.SERVICE, URLType.TIPS]
-
-        # Phase 1: Initial scraping pass
-        logger.info("Phase 1: Initial content scraping pass")
-        for url_type in content_types:
-            urls = [cu.url for cu in categorized.get(url_type, [])]
-            discovered += len(urls)
+        # Get content URLs (general, service, tips); a URL listed under more
+        # than one type is scraped once, under the first type it appears in
+        all_urls = []
+        seen_urls: set[str] = set()
+        for url_type in CONTENT_URL_TYPES:
+            for cu in categorized.get(url_type, []):
+                if cu.url not in seen_urls:
+                    seen_urls.add(cu.url)
+                    all_urls.append((cu.url, url_type))
+        stats = ScrapeStats(discovered=len(all_urls))
+
+        # Pages are fetched concurrently under an AIMD-adapted limit; outcomes are
+        # written to the DB in batches
+        sem = AdaptiveSemaphore(initial=self.content_concurrency)
+        batch = BatchWriter(session)
+        loop = asyncio.get_running_loop()
+
+        async def _one(url: str, url_type: URLType, deadline: Optional[float] = None) -> bool:
+            """Scrape and save one URL, record the outcome, return success.
+
+            With a deadline (loop time), the fetch is capped at retry_timeout
+            and skipped without recording anything once the deadline has passed.
+            """
+            async with sem:
+                timeout = None
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        return False
+                    timeout = min(self.retry_timeout, remaining)
 
-            for url in urls:
                 try:
-                    await url_repo.upsert(url, url_type)
+                    async with asyncio.timeout(timeout):
+                        result = await self.content_scraper.scrape_and_save(url)
+                except TimeoutError:
+                    logger.error(f"Timed out scraping content {url}")
+                    result = {"success": False, "error": "Timed out"}
+
+                success = bool(result.get("success"))
+                if success:
+                    sem.record_success()
+                else:
+                    sem.record_failure()
+
+            await batch.record(url, url_type, result)
+
+            if not success:
+                logger.warning(f"Failed to scrape {url}: {result.get('error', 'Unknown')}")
+                return False
+
+            self._events.publish(
+                EventType.CONTENT_SAVED,
+                {"url": url, "file_path": result.get("file_path")},
+            )
+            return True
 
-                    result = await self.content_scraper.scrape_and_save(url)
+        async def _retry_one(scraped_url, deadline: float) -> bool:
+            """Retry a previously failed URL."""
+            url = scraped_url.url
+            logger.info(f"Retrying {url} (attempt {scraped_url.retry_count + 1}/{max_retries})")
+            success = await _one(url, scraped_url.url_type, deadline)
+            if success:
+                logger.info(f"✓ Retry successful for {url}")
+            return success
 
-                    if result.get("success"):
-                        scraped += 1
-                        await url_repo.mark_success(
-                            url,
-                            result.get("content_hash", ""),
-                            result.get("file_path"),
-                        )
-                        await emit_event(
-                            EventType.CONTENT_SAVED,
-                            {"url": url, "file_path": result.get("file_path")},
-                        )
-                        await session.commit()  # Commit after each success
-                    else:
-                        failed += 1
-                        await url_repo.mark_failed(url, result.get("error", "Unknown"))
-                        await session.commit()  # Commit failures too
-                        logger.warning(f"Failed to scrape {url}: {result.get('error', 'Unknown')}")
-
-                except Exception as e:
-                    logger.error(f"Failed to scrape content {url}: {e}")
-                    failed += 1
-                    try:
-                        await url_repo.mark_failed(url, str(e))
-                        await session.commit()  # Commit failures
-                    except Exception as db_error:
-                        logger.error(f"Failed to mark URL as failed: {db_error}")
-                        await session.rollback()
+        # Phase 1: Initial scraping pass
+        logger.info("Phase 1: Initial content scraping pass")
+        results = await asyncio.gather(*(_one(url, url_type) for url, url_type in all_urls))
+        await batch.flush()
+        stats.scraped = sum(results)
+        stats.failed = len(results) - stats.scraped
 
         # Phase 2: Retry failed URLs (max 3 retries)
-        logger.info(f"Phase 1 complete. Scraped: {scraped}, Failed: {failed}")
+        logger.info(f"Phase 1 complete. Scraped: {stats.scraped}, Failed: {stats.failed}")
 
+        # The whole retry phase shares one wall-clock budget so a batch of
+        # stalling URLs cannot hold the run open
         max_retries = 3
+        deadline = loop.time() + self.retry_budget
         for retry_attempt in range(1, max_retries + 1):
+            if loop.time() >= deadline:
+                logger.warning(f"Retry budget of {self.retry_budget}s spent, stopping retry loop")
+                break
+
             # Get failed URLs that haven't exceeded max retries
             failed_urls = await url_repo.get_failed(max_retries=max_retries)
 
@@ -338,48 +477,15 @@ class PipelineOrchestrator:
 
             logger.info(f"Phase 2 - Retry attempt {retry_attempt}: Retrying {len(failed_urls)} failed URLs")
 
-            retried = 0
-            retry_success = 0
-
-            for scraped_url in failed_urls:
-                url = scraped_url.url
-
-                try:
-                    logger.info(f"Retrying {url} (attempt {scraped_url.retry_count + 1}/{max_retries})")
-
-                    # Use longer timeout for retries
-                    result = await self.content_scraper.scrape_and_save(url)
-
-                    if result.get("success"):
-                        retry_success += 1
-                        scraped += 1
-                        failed -= 1  # Reduce failed count
-                        await url_repo.mark_success(
-                            url,
-                            result.get("content_hash", ""),
-                            result.get("file_path"),
-                        )
-                        await emit_event(
-                            EventType.CONTENT_SAVED,
-                            {"url": url, "file_path": result.get("file_path")},
-                        )
-                        await session.commit()
-                        logger.info(f"✓ Retry successful for {url}")
-                    else:
-                        await url_repo.mark_failed(url, result.get("error", "Unknown"))
-                        await session.commit()
-                        logger.warning(f"Retry failed for {url}: {result.get('error', 'Unknown')}")
-
-                    retried += 1
-
-                except Exception as e:
-                    logger.error(f"Exception during retry for {url}: {e}")
-                    try:
-                        await url_repo.mark_failed(url, str(e))
-                        await session.commit()
-                    except Exception as db_error:
-                        logger.error(f"Failed to mark URL as failed: {db_error}")
-                        await session.rollback()
+            # _one never raises, so one bad URL cannot cancel its siblings
+            async with asyncio.TaskGroup() as tg:
+                retry_tasks = [tg.create_task(_retry_one(su, deadline)) for su in failed_urls]
+            await batch.flush()
+            retry_results = [task.result() for task in retry_tasks]
+            retried = len(retry_results)
+            retry_success = sum(retry_results)
+            stats.scraped += retry_success
+            stats.failed -= retry_success  # Reduce failed count
 
             logger.info(f"Retry attempt {retry_attempt} complete. Retried: {retried}, Successful: {retry_success}")
 
@@ -388,30 +494,27 @@ class PipelineOrchestrator:
                 logger.info("No successful retries in this attempt, stopping retry loop")
                 break
 
-        # Final commit in case any pending
-        try:
-            await session.commit()
-        except Exception:
-            pass  # Already committed incrementally
+        await self._events.flush()
 
-        logger.info(f"Content scraping complete. Total - Discovered: {discovered}, Scraped: {scraped}, Failed: {failed}")
+        # Don't keep a headless browser idling between scheduled runs
+        await self.content_scraper.aclose()
 
-        return {
-            "discovered": discovered,
-            "scraped": scraped,
-            "failed": failed,
-        }
+        logger.info(
+            f"Content scraping complete. Total - Discovered: {stats.discovered}, "
+            f"Scraped: {stats.scraped}, Failed: {stats.failed}"
+        )
+        return stats
 
     async def refresh_sitemap(self) -> list[str]:
         """Refresh the sitemap cache and return new URLs."""
         logger.info("Refreshing sitemap")
-        urls = self.sitemap_crawler.discover_urls()
+        self.sitemap_crawler.invalidate()
+        urls = await asyncio.to_thread(self.sitemap_crawler.discover_urls)
         return urls
 
 
 def main():
     """CLI entry point for running the orchestrator."""
-    import asyncio
     from ..utils.config import get_settings
     from ..utils.logging import setup_logging
 
@@ -424,7 +527,19 @@ def main():
         content_dir=settings.general_content_dir,
     )
 
-    asyncio.run(orchestrator.run_full_scrape())
+    # uvloop is much faster for many-coroutine HTTP workloads; not available on Windows
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    async def _run() -> None:
+        async with orchestrator:
+            await orchestrator.run_full_scrape()
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(_run())
 
 
 if __name__ == "__main__":
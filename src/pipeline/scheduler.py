@@ -36,48 +36,57 @@ class ScrapeScheduler:
         self.scheduler = AsyncIOScheduler()
         self._running = False
 
+        # Schedule config is read once; setup_schedules may run repeatedly
+        self._auto_scraping = self.yaml_config.get("scheduling.enable_auto_scraping", False)
+        self._animal_hours = self.yaml_config.get("scheduling.animal_scrape_hours", 4)
+        self._content_hour = self.yaml_config.get("scheduling.content_scrape_hour", 2)
+        self._sitemap_day = self.yaml_config.get("scheduling.sitemap_refresh_day", "sun")
+
     def setup_schedules(self) -> None:
         """Configure all scheduled jobs."""
         # Check if auto scraping is enabled
-        enable_auto_scraping = self.yaml_config.get("scheduling.enable_auto_scraping", False)
-        if not enable_auto_scraping:
+        if not self._auto_scraping:
             logger.info("Auto scraping is disabled. Scheduled jobs will not be set up.")
             return
 
-        # Get schedule config
-        animal_hours = self.yaml_config.get("scheduling.animal_scrape_hours", 4)
-        content_hour = self.yaml_config.get("scheduling.content_scrape_hour", 2)
-        sitemap_day = self.yaml_config.get("scheduling.sitemap_refresh_day", "sun")
+        animal_hours = self._animal_hours
+        content_hour = self._content_hour
+        sitemap_day = self._sitemap_day
 
         # Animals: Scrape every N hours (default: 4)
-        self.scheduler.add_job(
+        if self._add_job_if_changed(
             self._run_animal_scrape,
             IntervalTrigger(hours=animal_hours),
             id="animal_scrape",
             name="Animal Pages Scrape",
-            replace_existing=True,
-        )
-        logger.info(f"Scheduled animal scrape every {animal_hours} hours")
+        ):
+            logger.info(f"Scheduled animal scrape every {animal_hours} hours")
 
         # General content: Daily at specified hour (default: 2 AM)
-        self.scheduler.add_job(
+        if self._add_job_if_changed(
             self._run_content_scrape,
             CronTrigger(hour=content_hour, minute=0),
             id="content_scrape",
             name="General Content Scrape",
-            replace_existing=True,
-        )
-        logger.info(f"Scheduled content scrape daily at {content_hour}:00")
+        ):
+            logger.info(f"Scheduled content scrape daily at {content_hour}:00")
 
         # Sitemap refresh: Weekly on specified day (default: Sunday 1 AM)
-        self.scheduler.add_job(
+        if self._add_job_if_changed(
             self._run_sitemap_refresh,
             CronTrigger(day_of_week=sitemap_day, hour=1, minute=0),
             id="sitemap_refresh",
             name="Sitemap Refresh",
-            replace_existing=True,
-        )
-        logger.info(f"Scheduled sitemap refresh on {sitemap_day} at 1:00")
+        ):
+            logger.info(f"Scheduled sitemap refresh on {sitemap_day} at 1:00")
+
+    def _add_job_if_changed(self, func, trigger, id: str, name: str) -> bool:
+        """Add or replace a job unless one with the same trigger already exists."""
+        existing = self.scheduler.get_job(id)
+        if existing is not None and str(existing.trigger) == str(trigger):
+            return False
+        self.scheduler.add_job(func, trigger, id=id, name=name, replace_existing=True)
+        return True
 
     async def _run_animal_scrape(self) -> None:
         """Run animal scrape job."""
@@ -144,16 +153,41 @@ async def run_scheduler() -> None:
 
     scheduler = ScrapeScheduler()
 
-    # Handle shutdown signals
-    loop = asyncio.get_event_loop()
+    # Handle shutdown signals: the first one shuts down gracefully, a second
+    # one falls through to the default handler so a stuck job can't block exit
+    loop = asyncio.get_running_loop()
     shutdown_event = asyncio.Event()
+    shutdown_signals = (signal.SIGTERM, signal.SIGINT)
 
-    def signal_handler():
-        logger.info("Received shutdown signal")
-        shutdown_event.set()
+    def restore_default_handler(sig: signal.Signals) -> None:
+        try:
+            loop.remove_signal_handler(sig)
+        except NotImplementedError:
+            signal.signal(
+                sig,
+                signal.default_int_handler if sig == signal.SIGINT else signal.SIG_DFL,
+            )
+
+    shutdown_requested = False
+
+    def signal_handler(sig: signal.Signals) -> None:
+        nonlocal shutdown_requested
+        if shutdown_requested:
+            logger.warning(f"Received second {sig.name}, forcing exit")
+            restore_default_handler(sig)
+            signal.raise_signal(sig)
+            return
+        logger.info(f"Received {sig.name}, shutting down")
+        shutdown_requested = True
+        # Also reached from a plain signal handler, so hand the event to the loop
+        loop.call_soon_threadsafe(shutdown_event.set)
 
-    for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(sig, signal_handler)
+    for sig in shutdown_signals:
+        try:
+            loop.add_signal_handler(sig, signal_handler, sig)
+        except NotImplementedError:
+            # Windows event loops don't support add_signal_handler
+            signal.signal(sig, lambda signum, _frame: signal_handler(signal.Signals(signum)))
 
     # Start scheduler
     scheduler.start()
@@ -161,20 +195,46 @@ async def run_scheduler() -> None:
     # Run an initial animal scrape on startup if auto scraping is enabled
     yaml_config = get_yaml_config()
     enable_auto_scraping = yaml_config.get("scheduling.enable_auto_scraping", False)
+    initial_scrape: Optional[asyncio.Task] = None
     if enable_auto_scraping:
+        async def run_initial_scrape() -> None:
+            try:
+                await scheduler.trigger_immediate("animals")
+            except Exception as e:
+                logger.error(f"Initial scrape failed: {e}")
+
+        # Run in the background so a shutdown signal isn't stuck behind it
         logger.info("Running initial animal scrape")
-        try:
-            await scheduler.trigger_immediate("animals")
-        except Exception as e:
-            logger.error(f"Initial scrape failed: {e}")
+        initial_scrape = asyncio.create_task(run_initial_scrape(), name="initial_animal_scrape")
     else:
         logger.info("Auto scraping is disabled. Skipping initial scrape on startup.")
 
     # Wait for shutdown
     await shutdown_event.wait()
 
-    # Cleanup
+    for sig in shutdown_signals:
+        try:
+            loop.remove_signal_handler(sig)
+        except NotImplementedError:
+            pass
+
+    # Cleanup: stop scheduling, then cancel in-flight jobs instead of
+    # waiting for their HTTP timeouts
     scheduler.shutdown()
+
+    if initial_scrape is not None and not initial_scrape.done():
+        logger.info("Cancelling initial animal scrape")
+        initial_scrape.cancel()
+        await asyncio.wait([initial_scrape], timeout=5.0)
+
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.info(f"Cancelling {len(pending)} pending tasks")
+        await asyncio.wait(pending, timeout=5.0)
+
+    await scheduler.orchestrator.aclose()
     logger.info("Scheduler shutdown complete")
 
 
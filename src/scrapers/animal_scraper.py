@@ -1,18 +1,40 @@
-"""Animal scraper using Zyte API and BeautifulSoup."""
+"""Animal scraper using Zyte API and selectolax."""
 
+import asyncio
+import base64
 import os
 import re
 from typing import Any, Optional
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 
 from .base import BaseScraper, RateLimiter
+from .url_categorizer import URLCategorizer
+
+_PAGE_NUMBER_RE = re.compile(r"/page/(\d+)/?")
+
+# Order of the "●"-separated quick-info segments on a pet card
+_INFO_KEYS = ("species", "age_category", "sex", "size")
+
+# Detail-page table labels mapped to model fields
+_FIELD_MAPPING = {
+    "reference number": "reference_number",
+    "species": "species",
+    "age": "age",
+    "sex": "sex",
+    "breed": "breed",
+    "size": "size",
+    "color": "color",
+    "declawed": "declawed",
+    "weight": "weight",
+}
 
 
 class AnimalScraper(BaseScraper):
-    """Scraper for animal pages using Zyte API + BeautifulSoup."""
+    """Scraper for animal pages using Zyte API + selectolax."""
 
     # Selectors for pet listing page
     PET_CARD_CONTAINER = "div.pet--row"
@@ -31,103 +53,142 @@ class AnimalScraper(BaseScraper):
         zyte_api_key: Optional[str] = None,
         rate_limiter: Optional[RateLimiter] = None,
         use_zyte: bool = True,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         super().__init__(rate_limiter=rate_limiter)
         self.zyte_api_key = zyte_api_key or os.getenv("ZYTE_API_KEY")
         self.use_zyte = use_zyte and bool(self.zyte_api_key)
         self.base_url = "https://www.spca.com"
+        self.http_client = http_client
+        # Only a client this scraper created itself is closed by aclose()
+        self._owns_client = False
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the injected HTTP client, creating a pooled one if none was given."""
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+            self._owns_client = True
+        return self.http_client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this scraper created it."""
+        if self._owns_client and self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+            self._owns_client = False
 
     async def _do_scrape(self, url: str) -> dict[str, Any]:
         """Scrape a URL and return raw HTML."""
-        html = await self._fetch_html(url)
+        try:
+            html = await self._fetch_html(url)
+        except httpx.TimeoutException as e:
+            self.logger.error(f"Timeout scraping {url}")
+            raise TimeoutError(f"Timeout scraping {url}") from e
         return {"url": url, "html": html, "success": True}
 
-    async def _fetch_html(self, url: str) -> str:
-        """Fetch HTML content from URL."""
+    async def _fetch_html(self, url: str) -> bytes:
+        """Fetch raw HTML bytes from URL; the parser handles encoding."""
         if self.use_zyte:
             return await self._fetch_with_zyte(url)
         else:
             return await self._fetch_with_httpx(url)
 
-    async def _fetch_with_zyte(self, url: str) -> str:
+    async def _fetch_with_zyte(self, url: str) -> bytes:
         """Fetch using Zyte API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.zyte.com/v1/extract",
-                auth=(self.zyte_api_key, ""),
-                json={
-                    "url": url,
-                    "httpResponseBody": True,
-                },
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Decode base64 response body
-            import base64
-            html_bytes = base64.b64decode(data.get("httpResponseBody", ""))
-            return html_bytes.decode("utf-8")
-
-    async def _fetch_with_httpx(self, url: str) -> str:
+        client = self._get_client()
+        response = await client.post(
+            "https://api.zyte.com/v1/extract",
+            auth=(self.zyte_api_key, ""),
+            json={
+                "url": url,
+                "httpResponseBody": True,
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        # Decode base64 response body
+        return base64.b64decode(data.get("httpResponseBody", ""))
+
+    async def _fetch_with_httpx(self, url: str) -> bytes:
         """Fetch using httpx (for development/testing)."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; SPCABot/1.0)",
-                },
-                timeout=30.0,
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-            return response.text
+        client = self._get_client()
+        response = await client.get(
+            url,
+            headers={
+                "User-Agent": "Mozilla/5.0 (compatible; SPCABot/1.0)",
+            },
+            timeout=self.timeout,
+            follow_redirects=True,
+        )
+        response.raise_for_status()
+        return response.content
 
     async def scrape_listing_page(self, url: str) -> list[dict[str, Any]]:
         """Scrape an adoption listing page to get all pet URLs."""
+        pets, _ = await self._scrape_listing(url)
+        return pets
+
+    async def _scrape_listing(self, url: str) -> tuple[list[dict[str, Any]], Optional[LexborHTMLParser]]:
+        """Scrape a listing page; also return its parsed tree for pagination lookups."""
         result = await self.scrape(url)
         if not result.get("success"):
-            return []
-
-        html = result.get("html", "")
-        soup = BeautifulSoup(html, "lxml")
-
+            return [], None
+
+        return await asyncio.to_thread(self._parse_listing_html, result.get("html", b""), url)
+
+    def _parse_listing_html(
+        self, html: str | bytes, url: str
+    ) -> tuple[list[dict[str, Any]], LexborHTMLParser]:
+        """Build the tree for a listing page and extract its pet cards."""
+        tree = LexborHTMLParser(html)
+        return self._parse_listing(tree, url), tree
+
+    def _last_page_number(self, tree: LexborHTMLParser, base_url: str) -> Optional[int]:
+        """Highest page number linked from a listing's pagination, if any."""
+        last_page = None
+        for link in tree.css("a[href]"):
+            href = urljoin(self.base_url, link.attributes.get("href") or "")
+            match = _PAGE_NUMBER_RE.fullmatch(href.removeprefix(base_url))
+            if match:
+                last_page = max(last_page or 0, int(match.group(1)))
+        return last_page
+
+    def _parse_listing(self, tree: LexborHTMLParser, url: str) -> list[dict[str, Any]]:
+        """Extract pet cards from a parsed listing page."""
         pets = []
-        pet_cards = soup.select(self.PET_CARD_SELECTOR)
+        pet_cards = tree.css(self.PET_CARD_SELECTOR)
 
         for card in pet_cards:
-            link = card.select_one(self.PET_LINK_SELECTOR)
+            link = card.css_first(self.PET_LINK_SELECTOR)
             if not link:
                 continue
 
-            pet_url = link.get("href", "")
+            pet_url = link.attributes.get("href") or ""
             if not pet_url.startswith("http"):
                 pet_url = urljoin(self.base_url, pet_url)
 
-            name_elem = card.select_one(self.PET_NAME_SELECTOR)
-            info_elem = card.select_one(self.PET_INFO_SELECTOR)
+            name_elem = card.css_first(self.PET_NAME_SELECTOR)
+            info_elem = card.css_first(self.PET_INFO_SELECTOR)
 
             # Parse quick info: "Dog ● Young ● Male ● L"
             quick_info = {}
             if info_elem:
-                info_text = info_elem.get_text(strip=True)
-                parts = [p.strip() for p in info_text.split("●")]
-                if len(parts) >= 1:
-                    quick_info["species"] = parts[0]
-                if len(parts) >= 2:
-                    quick_info["age_category"] = parts[1]
-                if len(parts) >= 3:
-                    quick_info["sex"] = parts[2]
-                if len(parts) >= 4:
-                    quick_info["size"] = parts[3]
+                # Stop splitting once past the segments we keep
+                parts = info_elem.text(strip=True).split("●", len(_INFO_KEYS))
+                quick_info = {key: part.strip() for key, part in zip(_INFO_KEYS, parts)}
 
             # Get thumbnail
-            img = card.select_one("div.card--image img")
-            thumbnail = img.get("src", "") if img else ""
+            img = card.css_first("div.card--image img")
+            thumbnail = (img.attributes.get("src") or "") if img else ""
 
             pets.append({
                 "url": pet_url,
-                "name": name_elem.get_text(strip=True) if name_elem else "",
+                "name": name_elem.text(strip=True) if name_elem else "",
                 "thumbnail": thumbnail,
                 **quick_info,
             })
@@ -135,30 +196,54 @@ class AnimalScraper(BaseScraper):
         self.logger.info(f"Found {len(pets)} pets on {url}")
         return pets
 
-    async def scrape_listing_with_pagination(self, base_url: str, max_pages: int = 50) -> list[dict[str, Any]]:
+    async def scrape_listing_with_pagination(
+        self,
+        base_url: str,
+        max_pages: int = 50,
+        max_concurrent: int = 5,
+    ) -> list[dict[str, Any]]:
         """
         Scrape all pages of an adoption listing until no more pets are found.
 
+        When page 1 links to the last page, pages 2..N are fetched
+        concurrently; otherwise pages are walked one by one until an empty one.
+
         Args:
             base_url: Base URL like https://www.spca.com/en/adoption/cats-for-adoption/
             max_pages: Maximum number of pages to scrape (safety limit)
+            max_concurrent: Maximum pages fetched at once when the page count is known
 
         Returns:
             List of all pets found across all pages
         """
-        all_pets = []
-        page = 1
-
         # Remove trailing slash for consistent URL building
         base_url = base_url.rstrip('/')
 
-        while page <= max_pages:
-            # Build page URL
-            if page == 1:
-                page_url = base_url + '/'
-            else:
-                page_url = f"{base_url}/page/{page}/"
+        self.logger.info(f"Scraping page 1: {base_url}/")
+        all_pets, tree = await self._scrape_listing(base_url + '/')
+        if not all_pets:
+            self.logger.info("No pets found on page 1, stopping pagination")
+            return []
+
+        last_page = self._last_page_number(tree, base_url)
+        if last_page is not None:
+            last_page = min(last_page, max_pages)
+            semaphore = asyncio.Semaphore(max_concurrent)
+
+            async def fetch_page(page: int) -> list[dict[str, Any]]:
+                async with semaphore:
+                    return await self.scrape_listing_page(f"{base_url}/page/{page}/")
 
+            pages = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+            for pets in pages:
+                all_pets.extend(pets)
+
+            self.logger.info(f"Pagination complete. Total pets found: {len(all_pets)} across {last_page} pages")
+            return all_pets
+
+        page = 2
+        while page <= max_pages:
+            page_url = f"{base_url}/page/{page}/"
             self.logger.info(f"Scraping page {page}: {page_url}")
 
             # Scrape this page
@@ -178,20 +263,29 @@ class AnimalScraper(BaseScraper):
         return all_pets
 
     async def scrape_animal_page(self, url: str) -> dict[str, Any]:
-        """Scrape an individual animal page for full details."""
-        result = await self.scrape(url)
+        """Scrape an individual animal page for full details.
+
+        Never raises: fetch errors come back as ``success=False`` results.
+        """
+        try:
+            result = await self.scrape(url)
+        except Exception as e:
+            self.logger.error(f"Failed to scrape {url}: {e}")
+            return {"url": url, "success": False, "error": str(e)}
+
         if not result.get("success"):
             return {"url": url, "success": False, "error": result.get("error")}
 
-        html = result.get("html", "")
-        return self.parse_animal_page(html, url)
+        # Parse in a worker thread so the event loop keeps serving other fetches
+        html = result.get("html", b"")
+        return await asyncio.to_thread(self.parse_animal_page, html, url)
 
-    def parse_animal_page(self, html: str, url: str) -> dict[str, Any]:
+    def parse_animal_page(self, html: str | bytes, url: str) -> dict[str, Any]:
         """Parse animal page HTML and extract all fields."""
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
         # Find the main container
-        container = soup.select_one(self.PET_PAGE_CONTAINER)
+        container = tree.css_first(self.PET_PAGE_CONTAINER)
         if not container:
             return {"url": url, "success": False, "error": "Pet container not found"}
 
@@ -201,41 +295,34 @@ class AnimalScraper(BaseScraper):
         }
 
         # Extract name from h2
-        name_elem = container.select_one("h2")
+        name_elem = container.css_first("h2")
         if name_elem:
-            animal_data["name"] = self.clean_text(name_elem.get_text())
+            animal_data["name"] = self.clean_text(name_elem.text())
 
-        # Extract description
-        desc_header = container.find("h5", string=re.compile(r"Description", re.I))
+        # Extract description: the first <p> sibling after the "Description" <h5>
+        desc_header = next(
+            (h5 for h5 in container.css("h5") if "description" in h5.text().lower()),
+            None,
+        )
         if desc_header:
-            desc_elem = desc_header.find_next_sibling("p")
+            desc_elem = desc_header.next
+            while desc_elem is not None and desc_elem.tag != "p":
+                desc_elem = desc_elem.next
             if desc_elem:
-                animal_data["description"] = self.clean_text(desc_elem.get_text())
+                animal_data["description"] = self.clean_text(desc_elem.text())
 
         # Extract table fields
-        table = container.select_one("table")
+        table = container.css_first("table")
         if table:
-            rows = table.select("tr")
+            rows = table.css("tr")
             for row in rows:
-                cells = row.select("td")
+                cells = row.css("td")
                 if len(cells) >= 2:
-                    field_name = self.clean_text(cells[0].get_text()).lower()
-                    field_value = self.clean_text(cells[1].get_text())
+                    field_name = self.clean_text(cells[0].text()).lower()
+                    field_value = self.clean_text(cells[1].text())
 
                     # Map field names to model fields
-                    field_mapping = {
-                        "reference number": "reference_number",
-                        "species": "species",
-                        "age": "age",
-                        "sex": "sex",
-                        "breed": "breed",
-                        "size": "size",
-                        "color": "color",
-                        "declawed": "declawed",
-                        "weight": "weight",
-                    }
-
-                    model_field = field_mapping.get(field_name)
+                    model_field = _FIELD_MAPPING.get(field_name)
                     if model_field:
                         if model_field == "declawed":
                             animal_data[model_field] = field_value.lower() == "yes"
@@ -244,17 +331,17 @@ class AnimalScraper(BaseScraper):
 
         # Extract images
         images = []
-        images_container = container.select_one(self.PET_IMAGES_CONTAINER)
+        images_container = container.css_first(self.PET_IMAGES_CONTAINER)
         if images_container:
             # Main image
-            main_img = images_container.select_one("img.rollover-parent")
-            if main_img and main_img.get("src"):
-                images.append(main_img["src"])
+            main_img = images_container.css_first("img.rollover-parent")
+            if main_img and main_img.attributes.get("src"):
+                images.append(main_img.attributes["src"])
 
             # Thumbnail images
-            thumbnails = images_container.select("div.pet--thumbnail img")
+            thumbnails = images_container.css("div.pet--thumbnail img")
             for thumb in thumbnails:
-                src = thumb.get("src")
+                src = thumb.attributes.get("src")
                 if src and src not in images:
                     images.append(src)
 
@@ -266,24 +353,39 @@ class AnimalScraper(BaseScraper):
 
         return animal_data
 
-    async def scrape_all_animals(self, language: str = "en") -> list[dict[str, Any]]:
+    async def scrape_all_animals(
+        self,
+        language: str = "en",
+        max_concurrent: int = 10,
+    ) -> list[dict[str, Any]]:
         """Scrape all animals from all adoption listing pages."""
-        from .url_categorizer import URLCategorizer
-
         listing_urls = URLCategorizer.get_adoption_urls(language)
-        all_animals = []
-
-        for listing_url in listing_urls:
-            self.logger.info(f"Scraping listing: {listing_url}")
-            pet_cards = await self.scrape_listing_page(listing_url)
-
-            for pet_card in pet_cards:
-                pet_url = pet_card.get("url")
-                if pet_url:
-                    self.logger.info(f"Scraping animal: {pet_url}")
-                    animal_data = await self.scrape_animal_page(pet_url)
-                    if animal_data.get("success"):
-                        all_animals.append(animal_data)
+
+        # Listings are independent; fetch them all at once
+        self.logger.info(f"Scraping {len(listing_urls)} listings")
+        cards_per_listing = await asyncio.gather(
+            *(self.scrape_listing_page(listing_url) for listing_url in listing_urls)
+        )
+        pet_urls = [
+            card["url"]
+            for pet_cards in cards_per_listing
+            for card in pet_cards
+            if card.get("url")
+        ]
+
+        # Fetch detail pages concurrently, then parse the ones that came back
+        self.logger.info(f"Scraping {len(pet_urls)} animal pages")
+        raw_results = await self.scrape_batch(pet_urls, max_concurrent=max_concurrent)
+
+        def parse_all() -> list[dict[str, Any]]:
+            parsed = (
+                self.parse_animal_page(raw.get("html", b""), raw["url"])
+                for raw in raw_results
+                if raw.get("success")
+            )
+            return [animal_data for animal_data in parsed if animal_data.get("success")]
+
+        all_animals = await asyncio.to_thread(parse_all)
 
         self.logger.info(f"Total animals scraped: {len(all_animals)}")
         return all_animals
@@ -3,7 +3,6 @@
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 import asyncio
-import hashlib
 import logging
 
 from tenacity import (
@@ -13,36 +12,95 @@ from tenacity import (
     retry_if_exception_type,
 )
 
+try:
+    from blake3 import blake3 as _content_hasher
+except ImportError:  # optional speedup; SHA-256 works the same for change detection
+    from hashlib import sha256 as _content_hasher
+
 logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
-    """Simple async rate limiter."""
+    """Simple async rate limiter.
+
+    Token bucket in its GCRA form: each caller reserves the next send slot
+    before sleeping, so no lock is needed (asyncio never preempts between
+    the read and the write) and waiters sleep concurrently.
+    """
 
     def __init__(self, requests_per_second: float = 0.5, burst: int = 3):
         self.requests_per_second = requests_per_second
         self.burst = burst
-        self.tokens = burst
-        self.last_update = asyncio.get_event_loop().time()
-        self._lock = asyncio.Lock()
+        self._interval = 1.0 / requests_per_second
+        # Up to `burst` requests may go out back-to-back
+        self._burst_tolerance = (burst - 1) * self._interval
+        # Theoretical arrival time of the next request
+        self._next_slot = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     async def acquire(self) -> None:
         """Wait until a request can be made."""
-        async with self._lock:
-            now = asyncio.get_event_loop().time()
-            time_passed = now - self.last_update
-            self.tokens = min(
-                self.burst,
-                self.tokens + time_passed * self.requests_per_second
-            )
-            self.last_update = now
-
-            if self.tokens < 1:
-                wait_time = (1 - self.tokens) / self.requests_per_second
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= 1
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        now = self._loop.time()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self._interval
+
+        wait_time = slot - self._burst_tolerance - now
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
+class AdaptiveSemaphore:
+    """Concurrency limiter whose limit adapts to the origin using AIMD.
+
+    Each success raises the limit by one (additive increase); each failure or
+    timeout multiplies it by ``md_factor`` (multiplicative decrease). This keeps
+    concurrency near the highest level the origin tolerates without timeout storms.
+    """
+
+    def __init__(
+        self,
+        initial: Optional[int] = None,
+        min_limit: int = 4,
+        max_limit: int = 128,
+        md_factor: float = 0.5,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.md_factor = md_factor
+        self.limit = max(min_limit, min(initial or min_limit, max_limit))
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        """Free a slot and wake waiters the current limit allows."""
+        async with self._cond:
+            self._in_flight -= 1
+            free = self.limit - self._in_flight
+            if free > 0:
+                self._cond.notify(free)
+
+    def record_success(self) -> None:
+        """Additively increase the limit after a successful request."""
+        self.limit = min(self.max_limit, self.limit + 1)
+
+    def record_failure(self) -> None:
+        """Multiplicatively decrease the limit after a failure or timeout."""
+        self.limit = max(self.min_limit, int(self.limit * self.md_factor))
+
+    async def __aenter__(self) -> "AdaptiveSemaphore":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.release()
 
 
 class BaseScraper(ABC):
@@ -65,19 +123,14 @@ class BaseScraper(ABC):
         retry=retry_if_exception_type((ConnectionError, TimeoutError, OSError)),
     )
     async def scrape(self, url: str) -> dict[str, Any]:
-        """Scrape a URL with rate limiting and retries."""
+        """Scrape a URL with rate limiting and retries.
+
+        Subclasses enforce ``self.timeout`` at the transport level and raise
+        TimeoutError when it expires.
+        """
         await self.rate_limiter.acquire()
         self.logger.debug(f"Scraping: {url}")
-
-        try:
-            result = await asyncio.wait_for(
-                self._do_scrape(url),
-                timeout=self.timeout
-            )
-            return result
-        except asyncio.TimeoutError:
-            self.logger.error(f"Timeout scraping {url}")
-            raise TimeoutError(f"Timeout scraping {url}")
+        return await self._do_scrape(url)
 
     @abstractmethod
     async def _do_scrape(self, url: str) -> dict[str, Any]:
@@ -104,16 +157,20 @@ class BaseScraper(ABC):
         return await asyncio.gather(*tasks)
 
     @staticmethod
-    def compute_hash(content: str) -> str:
-        """Compute SHA256 hash of content for change detection."""
-        return hashlib.sha256(content.encode()).hexdigest()
+    def compute_hash(content: str | bytes) -> str:
+        """Compute a 64-char hex hash of content for change detection.
+
+        Uses BLAKE3 when installed, SHA-256 otherwise. Pass bytes when they
+        are already at hand to skip re-encoding.
+        """
+        if isinstance(content, str):
+            content = content.encode()
+        return _content_hasher(content).hexdigest()
 
     @staticmethod
     def clean_text(text: str) -> str:
         """Clean and normalize text content."""
         if not text:
             return ""
-        # Remove extra whitespace
-        import re
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Collapse runs of whitespace and trim the ends
+        return " ".join(text.split())
@@ -1,5 +1,6 @@
 """Content scraper using Crawl4AI for general website content."""
 
+import asyncio
 import os
 import re
 from pathlib import Path
@@ -11,6 +12,9 @@ from crawl4ai.extraction_strategy import NoExtractionStrategy
 
 from .base import BaseScraper, RateLimiter
 
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]+)</title>", re.IGNORECASE)
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\-_]")
+
 
 class ContentScraper(BaseScraper):
     """Scraper for general content using Crawl4AI."""
@@ -23,37 +27,59 @@ class ContentScraper(BaseScraper):
         super().__init__(rate_limiter=rate_limiter)
         self.content_dir = Path(content_dir)
         self.content_dir.mkdir(parents=True, exist_ok=True)
+        # One headless browser shared by every scrape; started on first use
+        self._crawler: Optional[AsyncWebCrawler] = None
+        self._crawler_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "ContentScraper":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def _get_crawler(self) -> AsyncWebCrawler:
+        """Return the shared crawler, launching the browser if needed."""
+        async with self._crawler_lock:
+            if self._crawler is None:
+                crawler = AsyncWebCrawler(verbose=False, headless=True)
+                await crawler.__aenter__()
+                self._crawler = crawler
+            return self._crawler
+
+    async def aclose(self) -> None:
+        """Shut down the shared browser; the next scrape starts a new one."""
+        async with self._crawler_lock:
+            if self._crawler is not None:
+                crawler, self._crawler = self._crawler, None
+                await crawler.__aexit__(None, None, None)
 
     async def _do_scrape(self, url: str) -> dict[str, Any]:
         """Scrape a URL using Crawl4AI."""
         try:
-            async with AsyncWebCrawler(
-                verbose=False,
-                headless=True,
-            ) as crawler:
-                result = await crawler.arun(
-                    url=url,
-                    extraction_strategy=NoExtractionStrategy(),
-                    bypass_cache=True,
-                    wait_for="networkidle",  # Wait for network to be idle
-                    page_timeout=30000,  # 30 seconds timeout
-                    delay_before_return_html=2.0,  # Wait 2 seconds before getting content
-                )
-
-                if result.success:
-                    return {
-                        "url": url,
-                        "html": result.html,
-                        "markdown": result.markdown,
-                        "title": self._extract_title(result.html),
-                        "success": True,
-                    }
-                else:
-                    return {
-                        "url": url,
-                        "success": False,
-                        "error": result.error_message or "Unknown error",
-                    }
+            crawler = await self._get_crawler()
+            result = await crawler.arun(
+                url=url,
+                extraction_strategy=NoExtractionStrategy(),
+                bypass_cache=True,
+                wait_for="networkidle",  # Wait for network to be idle
+                page_timeout=self.timeout * 1000,  # ms
+                delay_before_return_html=2.0,  # Wait 2 seconds before getting content
+            )
+
+            if result.success:
+                return {
+                    "url": url,
+                    "html": result.html,
+                    "markdown": result.markdown,
+                    "title": self._extract_title(result.html),
+                    "success": True,
+                }
+            else:
+                return {
+                    "url": url,
+                    "success": False,
+                    "error": result.error_message or "Unknown error",
+                }
         except Exception as e:
             self.logger.error(f"Error scraping {url}: {e}")
             return {
@@ -64,15 +90,21 @@ class ContentScraper(BaseScraper):
 
     def _extract_title(self, html: str) -> str:
         """Extract page title from HTML."""
-        import re
-        match = re.search(r"<title[^>]*>([^<]+)</title>", html, re.IGNORECASE)
+        match = _TITLE_RE.search(html)
         if match:
             return self.clean_text(match.group(1))
         return ""
 
     async def scrape_and_save(self, url: str) -> dict[str, Any]:
-        """Scrape a URL and save as markdown file."""
-        result = await self.scrape(url)
+        """Scrape a URL and save as markdown file.
+
+        Never raises: fetch and write errors come back as ``success=False`` results.
+        """
+        try:
+            result = await self.scrape(url)
+        except Exception as e:
+            self.logger.error(f"Failed to scrape {url}: {e}")
+            return {"url": url, "success": False, "error": str(e)}
 
         if not result.get("success"):
             return result
@@ -88,11 +120,18 @@ class ContentScraper(BaseScraper):
             content=result.get("markdown", ""),
         )
 
-        # Save to file
-        filepath.write_text(markdown_content, encoding="utf-8")
+        # Encode once for both the file write and the hash
+        content_bytes = markdown_content.encode("utf-8")
+
+        # Save to file off the event loop so concurrent scrapes keep running
+        try:
+            await asyncio.to_thread(filepath.write_bytes, content_bytes)
+        except OSError as e:
+            self.logger.error(f"Failed to write {filepath}: {e}")
+            return {"url": url, "success": False, "error": str(e)}
 
         # Compute hash
-        content_hash = self.compute_hash(markdown_content)
+        content_hash = self.compute_hash(content_bytes)
 
         result["file_path"] = str(filepath)
         result["content_hash"] = content_hash
@@ -112,7 +151,7 @@ class ContentScraper(BaseScraper):
         filename = path.replace("/", "_")
 
         # Remove unsafe characters
-        filename = re.sub(r"[^\w\-_]", "", filename)
+        filename = _UNSAFE_FILENAME_RE.sub("", filename)
 
         # Limit length
         if len(filename) > 100:
@@ -122,16 +161,7 @@ class ContentScraper(BaseScraper):
 
     def _prepare_markdown(self, url: str, title: str, content: str) -> str:
         """Prepare markdown content with metadata header."""
-        lines = [
-            f"# {title}" if title else "# Untitled",
-            "",
-            f"Source: {url}",
-            "",
-            "---",
-            "",
-            content,
-        ]
-        return "\n".join(lines)
+        return f"# {title or 'Untitled'}\n\nSource: {url}\n\n---\n\n{content}"
 
     async def scrape_batch_and_save(
         self,
@@ -139,8 +169,6 @@ class ContentScraper(BaseScraper):
         max_concurrent: int = 3,
     ) -> list[dict[str, Any]]:
         """Scrape multiple URLs and save each as markdown."""
-        import asyncio
-
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def scrape_one(url: str) -> dict[str, Any]:
@@ -152,7 +180,10 @@ class ContentScraper(BaseScraper):
                     return {"url": url, "success": False, "error": str(e)}
 
         tasks = [scrape_one(url) for url in urls]
-        return await asyncio.gather(*tasks)
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            await self.aclose()
 
     def get_saved_files(self) -> list[Path]:
         """Get list of all saved content files."""
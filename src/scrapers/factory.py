@@ -3,9 +3,11 @@
 from enum import Enum
 from typing import Type, Optional
 
+from ..database.models import URLType
 from .base import BaseScraper, RateLimiter
 from .animal_scraper import AnimalScraper
 from .content_scraper import ContentScraper
+from .url_categorizer import URLCategorizer
 
 
 class ScraperType(Enum):
@@ -48,9 +50,6 @@ class ScraperFactory:
         **kwargs,
     ) -> BaseScraper:
         """Automatically select scraper based on URL pattern."""
-        from .url_categorizer import URLCategorizer
-        from ..database.models import URLType
-
         categorized = URLCategorizer.categorize(url)
 
         if categorized.url_type == URLType.ANIMAL:
@@ -84,5 +83,9 @@ class ScraperFactory:
         cls,
         content_dir: str = "./content/general",
     ) -> ContentScraper:
-        """Get a content scraper instance."""
+        """Get a content scraper instance.
+
+        The scraper keeps one headless browser open across scrapes; call
+        ``aclose()`` (or use it as an async context manager) when done.
+        """
         return ContentScraper(content_dir=content_dir)
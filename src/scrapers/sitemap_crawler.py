@@ -1,10 +1,12 @@
 """Sitemap crawler using ultimate-sitemap-parser."""
 
 import logging
-from typing import List
+import time
+from typing import List, Optional
 
 from usp.tree import sitemap_tree_for_homepage
 
+from ..database.models import URLType
 from .url_categorizer import URLCategorizer, CategorizedURL
 
 logger = logging.getLogger(__name__)
@@ -13,19 +15,43 @@ logger = logging.getLogger(__name__)
 class SitemapCrawler:
     """Crawl website sitemap to discover all URLs."""
 
-    def __init__(self, base_url: str = "https://www.spca.com/en/", sitemap_url: str = "https://www.spca.com/sitemap_index.xml"):
+    def __init__(
+        self,
+        base_url: str = "https://www.spca.com/en/",
+        sitemap_url: str = "https://www.spca.com/sitemap_index.xml",
+        cache_ttl: float = 3600.0,
+    ):
         self.base_url = base_url
         self.sitemap_url = sitemap_url
+        self.cache_ttl = cache_ttl
+        self._urls_cache: Optional[List[str]] = None
+        self._categorized_cache: Optional[dict] = None
+        self._cached_at = 0.0
+
+    def invalidate(self) -> None:
+        """Drop cached sitemap results so the next call refetches."""
+        self._urls_cache = None
+        self._categorized_cache = None
+
+    def _cache_fresh(self) -> bool:
+        return time.monotonic() - self._cached_at < self.cache_ttl
 
     def discover_urls(self) -> List[str]:
-        """Discover all URLs from sitemap."""
+        """Discover all URLs from sitemap (cached for cache_ttl seconds)."""
+        if self._urls_cache is not None and self._cache_fresh():
+            return self._urls_cache
+
         logger.info(f"Discovering URLs from sitemap: {self.sitemap_url}")
 
         try:
             # Use the explicit sitemap URL instead of auto-discovery
             tree = sitemap_tree_for_homepage(self.sitemap_url)
-            urls = [page.url for page in tree.all_pages()]
+            # Sitemaps often list a page more than once; keep first-seen order
+            urls = list(dict.fromkeys(page.url for page in tree.all_pages()))
             logger.info(f"Discovered {len(urls)} URLs from sitemap")
+            self._urls_cache = urls
+            self._categorized_cache = None
+            self._cached_at = time.monotonic()
             return urls
         except Exception as e:
             logger.error(f"Error discovering URLs: {e}")
@@ -34,12 +60,17 @@ class SitemapCrawler:
     def discover_and_categorize(self) -> dict:
         """Discover URLs and categorize them."""
         urls = self.discover_urls()
+        if self._categorized_cache is not None and urls is self._urls_cache:
+            return self._categorized_cache
+
         categorized = URLCategorizer.categorize_batch(urls)
 
         # Log summary
         for url_type, url_list in categorized.items():
             logger.info(f"  {url_type.value}: {len(url_list)} URLs")
 
+        if urls is self._urls_cache:
+            self._categorized_cache = categorized
         return categorized
 
     def get_scrapable_urls(self) -> List[CategorizedURL]:
@@ -49,16 +80,12 @@ class SitemapCrawler:
 
     def get_animal_urls(self) -> List[str]:
         """Get only animal page URLs."""
-        from ..database.models import URLType
-
         categorized = self.discover_and_categorize()
         animal_urls = categorized.get(URLType.ANIMAL, [])
         return [cu.url for cu in animal_urls]
 
     def get_content_urls(self) -> List[str]:
         """Get general content URLs (excluding animals)."""
-        from ..database.models import URLType
-
         categorized = self.discover_and_categorize()
 
         content_urls = []
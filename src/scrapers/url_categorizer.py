@@ -1,15 +1,21 @@
 """URL categorizer for routing URLs to appropriate scrapers."""
 
+import functools
+import operator
 import re
 from dataclasses import dataclass
 from typing import List
+from urllib.parse import urlsplit
 
 from ..database.models import URLType
 
+# URL format: /animal/name-species-REFERENCE/
+_ANIMAL_REF_RE = re.compile(r"/animal/[\w-]+-(\d+)/?")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CategorizedURL:
-    """A URL with its categorization."""
+    """A URL with its categorization (immutable, so memoized results can be shared)."""
     url: str
     url_type: URLType
     priority: int  # Lower = higher priority
@@ -19,34 +25,43 @@ class CategorizedURL:
 class URLCategorizer:
     """Categorize URLs based on patterns for routing to appropriate scrapers."""
 
-    # Patterns: (regex, url_type, priority)
-    PATTERNS = [
-        # Animal individual pages (highest priority - change frequently)
-        (r"/en/animal/[\w-]+-\d+/?", URLType.ANIMAL, 1),
-        (r"/fr/animal/[\w-]+-\d+/?", URLType.ANIMAL, 1),
-
-        # Adoption listing pages
-        (r"/en/adoption/[\w-]+-for-adoption/?", URLType.ADOPTION_LIST, 2),
-        (r"/fr/adoption/[\w-]+-a-adopter/?", URLType.ADOPTION_LIST, 2),
-
-        # Service pages
-        (r"/en/services/", URLType.SERVICE, 3),
-        (r"/fr/services/", URLType.SERVICE, 3),
-
-        # Tips and advice
-        (r"/en/tips-and-advice/", URLType.TIPS, 4),
-        (r"/fr/conseils/", URLType.TIPS, 4),
-
-        # Ignored patterns (media, calendar, etc.)
-        (r"\.(pdf|jpg|jpeg|png|gif|mp4|mp3|doc|docx|xls|xlsx)$", URLType.IGNORED, 99),
-        (r"/wp-content/", URLType.IGNORED, 99),
-        (r"/wp-admin/", URLType.IGNORED, 99),
-        (r"/calendar/", URLType.IGNORED, 99),
-        (r"/feed/", URLType.IGNORED, 99),
-        (r"/cart/", URLType.IGNORED, 99),
-        (r"/checkout/", URLType.IGNORED, 99),
-        (r"/my-account/", URLType.IGNORED, 99),
-    ]
+    # Section dispatch on the first two path segments: (language, section)
+    SECTIONS = {
+        ("en", "animal"): URLType.ANIMAL,
+        ("fr", "animal"): URLType.ANIMAL,
+        ("en", "adoption"): URLType.ADOPTION_LIST,
+        ("fr", "adoption"): URLType.ADOPTION_LIST,
+        ("en", "services"): URLType.SERVICE,
+        ("fr", "services"): URLType.SERVICE,
+        ("en", "tips-and-advice"): URLType.TIPS,
+        ("fr", "conseils"): URLType.TIPS,
+    }
+
+    # Lower = higher priority; animals change most frequently
+    PRIORITIES = {
+        URLType.ANIMAL: 1,
+        URLType.ADOPTION_LIST: 2,
+        URLType.SERVICE: 3,
+        URLType.TIPS: 4,
+        URLType.GENERAL: 5,
+        URLType.IGNORED: 99,
+    }
+
+    # Ignored: media/document files and non-content directories
+    IGNORED_EXTENSIONS = (
+        ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".mp4", ".mp3", ".doc", ".docx", ".xls", ".xlsx",
+    )
+    IGNORED_DIRECTORIES = frozenset({
+        "wp-content", "wp-admin", "calendar", "feed", "cart", "checkout", "my-account",
+    })
+
+    # Sections that also require the rest of the path to match a slug pattern
+    _SLUG_PATTERNS = {
+        ("en", "animal"): re.compile(r"[\w-]+-\d+"),
+        ("fr", "animal"): re.compile(r"[\w-]+-\d+"),
+        ("en", "adoption"): re.compile(r"[\w-]+-for-adoption"),
+        ("fr", "adoption"): re.compile(r"[\w-]+-a-adopter"),
+    }
 
     # Adoption listing URLs (entry points for animal discovery)
     ADOPTION_URLS = {
@@ -67,29 +82,44 @@ class URLCategorizer:
     }
 
     @classmethod
+    @functools.lru_cache(maxsize=8192)
     def categorize(cls, url: str) -> CategorizedURL:
-        """Categorize a single URL."""
-        # Detect language
-        language = "fr" if "/fr/" in url else "en"
-
-        # Check against patterns
-        for pattern, url_type, priority in cls.PATTERNS:
-            if re.search(pattern, url, re.IGNORECASE):
-                return CategorizedURL(
-                    url=url,
-                    url_type=url_type,
-                    priority=priority,
-                    language=language,
-                )
+        """Categorize a single URL (memoized; treat the result as read-only)."""
+        path = urlsplit(url).path.lower()
+        # "/en/animal/rex-12345/" -> ["", "en", "animal", "rex-12345/"]
+        segments = path.split("/", 3)
 
-        # Default to general content
+        # Language is the first path segment
+        language = "fr" if len(segments) > 1 and segments[1] == "fr" else "en"
+
+        url_type = cls._classify_path(path, segments)
         return CategorizedURL(
             url=url,
-            url_type=URLType.GENERAL,
-            priority=5,
+            url_type=url_type,
+            priority=cls.PRIORITIES[url_type],
             language=language,
         )
 
+    @classmethod
+    def _classify_path(cls, path: str, segments: List[str]) -> URLType:
+        """Classify a lowercased URL path by section, then by ignore rules."""
+        if len(segments) >= 3:
+            key = (segments[1], segments[2])
+            url_type = cls.SECTIONS.get(key)
+            if url_type is not None:
+                slug_pattern = cls._SLUG_PATTERNS.get(key)
+                rest = segments[3] if len(segments) > 3 else ""
+                if slug_pattern is None or slug_pattern.match(rest):
+                    return url_type
+
+        if path.endswith(cls.IGNORED_EXTENSIONS):
+            return URLType.IGNORED
+        if not cls.IGNORED_DIRECTORIES.isdisjoint(path.rpartition("/")[0].split("/")):
+            return URLType.IGNORED
+
+        # Default to general content
+        return URLType.GENERAL
+
     @classmethod
     def categorize_batch(cls, urls: List[str]) -> dict[URLType, List[CategorizedURL]]:
         """Categorize multiple URLs and group by type."""
@@ -99,10 +129,7 @@ class URLCategorizer:
             categorized = cls.categorize(url)
             grouped[categorized.url_type].append(categorized)
 
-        # Sort each group by priority
-        for url_type in grouped:
-            grouped[url_type].sort(key=lambda x: x.priority)
-
+        # Priority is fixed per URL type, so each group is already in order
         return grouped
 
     @classmethod
@@ -123,8 +150,7 @@ class URLCategorizer:
     @classmethod
     def extract_reference_number(cls, url: str) -> str | None:
         """Extract animal reference number from URL."""
-        # URL format: /animal/name-species-REFERENCE/
-        match = re.search(r"/animal/[\w-]+-(\d+)/?", url)
+        match = _ANIMAL_REF_RE.search(url)
         if match:
             return match.group(1)
         return None
@@ -132,13 +158,12 @@ class URLCategorizer:
     @classmethod
     def filter_scrapable(cls, urls: List[str]) -> List[CategorizedURL]:
         """Filter and categorize only scrapable URLs."""
-        categorized = cls.categorize_batch(urls)
-
         scrapable = []
-        for url_type, urls_list in categorized.items():
-            if url_type != URLType.IGNORED:
-                scrapable.extend(urls_list)
+        for url in urls:
+            categorized = cls.categorize(url)
+            if categorized.url_type is not URLType.IGNORED:
+                scrapable.append(categorized)
 
-        # Sort by priority
-        scrapable.sort(key=lambda x: x.priority)
+        # Sort by priority (stable, so sitemap order is kept within a priority)
+        scrapable.sort(key=operator.attrgetter("priority"))
         return scrapable
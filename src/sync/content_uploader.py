@@ -1,20 +1,48 @@
 """Content uploader for syncing to Google File Search."""
 
 import asyncio
+import functools
 import hashlib
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Callable, Optional
 
 from ..database.session import get_session
 from ..database.repositories.animal_repository import AnimalRepository
 from ..database.repositories.scrape_repository import SyncLogRepository
-from ..database.models import AnimalStatus
+from ..database.models import Animal, AnimalStatus, SyncLog
 from ..pipeline.events import EventType, emit_event
 from .file_search_client import FileSearchClient
 
 logger = logging.getLogger(__name__)
 
+# Change detection only, so a fast non-interop hash is fine; 32 bytes keeps
+# the 64-char hex content_hash column format
+_content_hasher = functools.partial(hashlib.blake2b, digest_size=32)
+
+# Animal columns copied verbatim into the File Search document payload
+_ANIMAL_SYNC_FIELDS = (
+    "reference_number",
+    "name",
+    "species",
+    "breed",
+    "age",
+    "sex",
+    "size",
+    "color",
+    "description",
+    "source_url",
+)
+
+
+def _animal_to_dict(animal: Animal) -> dict:
+    """Build the sync payload for an Animal row."""
+    data = {field: getattr(animal, field) for field in _ANIMAL_SYNC_FIELDS}
+    data["status"] = animal.status.value if animal.status else "available"
+    data["images_url"] = animal.images_url or []
+    data["google_file_id"] = animal.google_file_id
+    return data
+
 
 class ContentUploader:
     """Uploads content to Google File Search."""
@@ -24,14 +52,159 @@ class ContentUploader:
         api_key: Optional[str] = None,
         content_dir: str = "./content/general",
         batch_size: int = 50,
+        max_concurrent: int = 16,
     ):
         self.client = FileSearchClient(api_key=api_key)
         self.content_dir = Path(content_dir)
         self.batch_size = batch_size
-
-    def compute_hash(self, content: str) -> str:
-        """Compute SHA256 hash of content for change detection."""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        self.max_concurrent = max_concurrent
+        # Caps in-flight File Search calls to stay within API rate limits
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    def compute_hash(self, content: str | bytes) -> str:
+        """Compute BLAKE2b-256 hash of content for change detection."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return _content_hasher(content).hexdigest()
+
+    def compute_file_hash(self, filepath: Path) -> str:
+        """Compute BLAKE2b-256 hash of a file's bytes without decoding it."""
+        with filepath.open("rb") as f:
+            return hashlib.file_digest(f, _content_hasher).hexdigest()
+
+    async def _sync_one(
+        self, animal_data: dict, synced_hash: Optional[str] = None
+    ) -> tuple[str, Optional[str], Optional[str], Optional[str]]:
+        """Upload one animal unless its document is unchanged since the last sync.
+
+        Returns (status, file_id, error, content_hash); a malformed animal comes
+        back as failed with no hash instead of raising out of the sync phase.
+        """
+        content_hash = None
+        try:
+            content_hash = self.compute_hash(self.client.format_animal_document(animal_data))
+            existing_file_id = animal_data["google_file_id"]
+            if existing_file_id and synced_hash == content_hash:
+                return "unchanged", existing_file_id, None, content_hash
+
+            async with self._semaphore:
+                file_id = await self.client.sync_animal(animal_data)
+        except Exception as e:
+            logger.error(f"Failed to sync animal {animal_data.get('reference_number')}: {e}")
+            return "failed", None, str(e), content_hash
+
+        if file_id:
+            return "success", file_id, None, content_hash
+        return "failed", None, "Upload returned None", content_hash
+
+    async def _upload_one(self, filepath: Path) -> Optional[str]:
+        """Read and upload one content file under the concurrency cap."""
+        async with self._semaphore:
+            # Decode only the files that are actually uploaded, off the event loop
+            content = await asyncio.to_thread(filepath.read_text, encoding="utf-8")
+            return await self.client.upload_file(content, filepath.name)
+
+    async def _remove_one(self, google_file_id: str) -> bool:
+        """Remove one file under the concurrency cap."""
+        async with self._semaphore:
+            return await self.client.remove_animal(google_file_id)
+
+    async def _sync_phase(
+        self,
+        action: str,
+        select_animals: Callable[[AnimalRepository], AsyncIterator[Animal]],
+    ) -> dict[str, int]:
+        """Stream animals into upload workers and record results every batch_size.
+
+        Reads run on their own session so the server-side cursor stays open
+        while finished uploads are committed through a second session.
+        """
+        counts = {"synced": 0, "unchanged": 0, "failed": 0}
+        queue: asyncio.Queue[Optional[tuple[int, str, Optional[str], dict]]] = asyncio.Queue(
+            maxsize=self.batch_size
+        )
+        finished: list[tuple[int, str, tuple]] = []
+        write_lock = asyncio.Lock()
+
+        async with get_session() as read_session, get_session() as write_session:
+            animal_repo = AnimalRepository(write_session)
+            sync_log_repo = SyncLogRepository(write_session)
+
+            async def record() -> None:
+                # Swap the buffer out first so workers keep appending meanwhile
+                async with write_lock:
+                    done = finished[:]
+                    finished.clear()
+                    if not done:
+                        return
+
+                    synced_ids: dict[int, str] = {}
+                    synced_hashes: dict[int, str] = {}
+                    log_entries: list[dict] = []
+                    for animal_id, reference_number, (status, file_id, error, content_hash) in done:
+                        if status == "unchanged":
+                            # Document is identical to the uploaded one; just record the sync
+                            synced_ids[animal_id] = file_id
+                            synced_hashes[animal_id] = content_hash
+                            counts["unchanged"] += 1
+                        elif status == "success":
+                            synced_ids[animal_id] = file_id
+                            synced_hashes[animal_id] = content_hash
+                            log_entries.append(dict(
+                                entity_type="animal",
+                                entity_id=reference_number,
+                                action=action,
+                                google_file_id=file_id,
+                                content_hash=content_hash,
+                            ))
+                            counts["synced"] += 1
+                        else:
+                            counts["failed"] += 1
+                            log_entries.append(dict(
+                                entity_type="animal",
+                                entity_id=reference_number,
+                                action=action,
+                                status="failed",
+                                error_message=error,
+                            ))
+
+                    await animal_repo.mark_synced_bulk(synced_ids, synced_hashes)
+                    await sync_log_repo.log_sync_many(log_entries)
+                    await write_session.commit()
+                    logger.info(
+                        f"Batch complete ({action}): {counts['synced']} synced, "
+                        f"{counts['unchanged']} unchanged, {counts['failed']} failed"
+                    )
+
+            async def produce() -> None:
+                async for animal in select_animals(AnimalRepository(read_session)):
+                    # Snapshot what the workers need so no ORM object crosses sessions
+                    await queue.put((
+                        animal.id,
+                        animal.reference_number,
+                        animal.synced_content_hash,
+                        _animal_to_dict(animal),
+                    ))
+                    read_session.expunge(animal)
+                for _ in range(self.max_concurrent):
+                    await queue.put(None)
+
+            async def work() -> None:
+                while (item := await queue.get()) is not None:
+                    animal_id, reference_number, synced_hash, payload = item
+                    result = await self._sync_one(payload, synced_hash)
+                    finished.append((animal_id, reference_number, result))
+                    if len(finished) >= self.batch_size:
+                        await record()
+
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(produce())
+                for _ in range(self.max_concurrent):
+                    tg.create_task(work())
+
+            await record()
+
+        return counts
 
     async def sync_all_animals(self) -> dict:
         """Sync all unsynced and modified animals to File Search."""
@@ -39,159 +212,35 @@ class ContentUploader:
 
         await emit_event(EventType.SYNC_STARTED, {"type": "animals"})
 
-        synced = 0
-        failed = 0
-        updated = 0
-
-        # Process all unsynced animals in batches
+        # Uploads start as soon as the first rows stream in
         logger.info("Phase 1: Syncing unsynced animals")
-        while True:
-            async with get_session() as session:
-                animal_repo = AnimalRepository(session)
-                sync_log_repo = SyncLogRepository(session)
+        created = await self._sync_phase("create", lambda repo: repo.iter_unsynced())
 
-                # Get next batch of unsynced animals
-                unsynced = await animal_repo.get_unsynced(limit=self.batch_size)
-
-                if not unsynced:
-                    logger.info("No more unsynced animals found")
-                    break
-
-                logger.info(f"Processing batch of {len(unsynced)} unsynced animals")
-
-                for animal in unsynced:
-                    try:
-                        # Convert to dict
-                        animal_data = {
-                            "reference_number": animal.reference_number,
-                            "name": animal.name,
-                            "species": animal.species,
-                            "breed": animal.breed,
-                            "age": animal.age,
-                            "sex": animal.sex,
-                            "size": animal.size,
-                            "color": animal.color,
-                            "description": animal.description,
-                            "status": animal.status.value if animal.status else "available",
-                            "source_url": animal.source_url,
-                            "images_url": animal.images_url if animal.images_url else [],
-                            "google_file_id": animal.google_file_id,
-                        }
-
-                        file_id = await self.client.sync_animal(animal_data)
-
-                        if file_id:
-                            await animal_repo.mark_synced(animal.id, file_id)
-                            await sync_log_repo.log_sync(
-                                entity_type="animal",
-                                entity_id=animal.reference_number,
-                                action="create",
-                                google_file_id=file_id,
-                            )
-                            synced += 1
-                        else:
-                            failed += 1
-                            await sync_log_repo.log_sync(
-                                entity_type="animal",
-                                entity_id=animal.reference_number,
-                                action="create",
-                                status="failed",
-                                error_message="Upload returned None",
-                            )
-
-                    except Exception as e:
-                        logger.error(f"Failed to sync animal {animal.reference_number}: {e}")
-                        failed += 1
-                        await sync_log_repo.log_sync(
-                            entity_type="animal",
-                            entity_id=animal.reference_number,
-                            action="create",
-                            status="failed",
-                            error_message=str(e),
-                        )
-
-                await session.commit()
-                logger.info(f"Batch complete: {synced} total synced, {failed} total failed")
-
-        # Process modified synced animals in batches
+        # Modified animals: sync_animal deletes old files and uploads new ones
         logger.info("Phase 2: Syncing modified animals")
-        while True:
-            async with get_session() as session:
-                animal_repo = AnimalRepository(session)
-                sync_log_repo = SyncLogRepository(session)
-
-                # Get next batch of modified synced animals
-                modified = await animal_repo.get_modified_synced(limit=self.batch_size)
+        modified = await self._sync_phase("update", lambda repo: repo.iter_modified_synced())
 
-                if not modified:
-                    logger.info("No modified synced animals found")
-                    break
-
-                logger.info(f"Processing batch of {len(modified)} modified animals")
-
-                for animal in modified:
-                    try:
-                        # Convert to dict
-                        animal_data = {
-                            "reference_number": animal.reference_number,
-                            "name": animal.name,
-                            "species": animal.species,
-                            "breed": animal.breed,
-                            "age": animal.age,
-                            "sex": animal.sex,
-                            "size": animal.size,
-                            "color": animal.color,
-                            "description": animal.description,
-                            "status": animal.status.value if animal.status else "available",
-                            "source_url": animal.source_url,
-                            "images_url": animal.images_url if animal.images_url else [],
-                            "google_file_id": animal.google_file_id,  # Pass existing ID for update
-                        }
-
-                        # This will delete old file and upload new one
-                        file_id = await self.client.sync_animal(animal_data)
-
-                        if file_id:
-                            await animal_repo.mark_synced(animal.id, file_id)
-                            await sync_log_repo.log_sync(
-                                entity_type="animal",
-                                entity_id=animal.reference_number,
-                                action="update",
-                                google_file_id=file_id,
-                            )
-                            updated += 1
-                            synced += 1
-                        else:
-                            failed += 1
-                            await sync_log_repo.log_sync(
-                                entity_type="animal",
-                                entity_id=animal.reference_number,
-                                action="update",
-                                status="failed",
-                                error_message="Upload returned None",
-                            )
-
-                    except Exception as e:
-                        logger.error(f"Failed to update animal {animal.reference_number}: {e}")
-                        failed += 1
-                        await sync_log_repo.log_sync(
-                            entity_type="animal",
-                            entity_id=animal.reference_number,
-                            action="update",
-                            status="failed",
-                            error_message=str(e),
-                        )
-
-                await session.commit()
-                logger.info(f"Batch complete: {synced} total synced ({updated} updates), {failed} total failed")
+        updated = modified["synced"]
+        synced = created["synced"] + updated
+        unchanged = created["unchanged"] + modified["unchanged"]
+        failed = created["failed"] + modified["failed"]
 
         await emit_event(
             EventType.SYNC_COMPLETED,
-            {"type": "animals", "synced": synced, "updated": updated, "failed": failed},
+            {
+                "type": "animals",
+                "synced": synced,
+                "updated": updated,
+                "unchanged": unchanged,
+                "failed": failed,
+            },
         )
 
-        logger.info(f"Animal sync complete: {synced} total synced ({updated} updates), {failed} failed")
-        return {"synced": synced, "updated": updated, "failed": failed}
+        logger.info(
+            f"Animal sync complete: {synced} total synced ({updated} updates), "
+            f"{unchanged} unchanged, {failed} failed"
+        )
+        return {"synced": synced, "updated": updated, "unchanged": unchanged, "failed": failed}
 
     async def sync_adopted_animals(self) -> dict:
         """Remove adopted animals from File Search."""
@@ -203,34 +252,37 @@ class ContentUploader:
         async with get_session() as session:
             animal_repo = AnimalRepository(session)
             sync_log_repo = SyncLogRepository(session)
-
-            # Get adopted animals that are still synced
-            adopted = await animal_repo.get_by_status(AnimalStatus.ADOPTED, limit=100)
-
-            for animal in adopted:
-                if animal.google_file_id:
-                    try:
-                        success = await self.client.remove_animal(animal.google_file_id)
-
-                        if success:
-                            # Clear the sync status
-                            animal.synced_to_google = False
-                            animal.google_file_id = None
-                            await sync_log_repo.log_sync(
-                                entity_type="animal",
-                                entity_id=animal.reference_number,
-                                action="delete",
-                            )
-                            removed += 1
-                        else:
-                            failed += 1
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to remove adopted animal {animal.reference_number}: {e}"
-                        )
-                        failed += 1
-
+            log_entries: list[dict] = []
+
+            # Only adopted animals that still have a File Search document
+            to_remove = await animal_repo.get_synced_by_status(AnimalStatus.ADOPTED)
+            removed_ids: list[int] = []
+
+            results = await asyncio.gather(
+                *(self._remove_one(animal.google_file_id) for animal in to_remove),
+                return_exceptions=True,
+            )
+
+            for animal, result in zip(to_remove, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Failed to remove adopted animal {animal.reference_number}: {result}"
+                    )
+                    failed += 1
+                elif result:
+                    removed_ids.append(animal.id)
+                    log_entries.append(dict(
+                        entity_type="animal",
+                        entity_id=animal.reference_number,
+                        action="delete",
+                    ))
+                    removed += 1
+                else:
+                    failed += 1
+
+            # Clear the sync status
+            await animal_repo.mark_unsynced_bulk(removed_ids)
+            await sync_log_repo.log_sync_many(log_entries)
             await session.commit()
 
         logger.info(f"Adopted animals sync: {removed} removed, {failed} failed")
@@ -260,20 +312,34 @@ class ContentUploader:
 
             async with get_session() as session:
                 sync_log_repo = SyncLogRepository(session)
+                log_entries: list[dict] = []
+                # (filepath, content_hash) for files that need uploading
+                pending: list[tuple[Path, str]] = []
+
+                # One query for the whole batch; rows arrive newest first
+                latest_syncs: dict[str, SyncLog] = {}
+                for log in await sync_log_repo.get_by_entities(
+                    "content", [filepath.name for filepath in batch]
+                ):
+                    latest_syncs.setdefault(log.entity_id, log)
+
+                # Hash the batch's files in worker threads, concurrently
+                hashes = await asyncio.gather(
+                    *(asyncio.to_thread(self.compute_file_hash, filepath) for filepath in batch),
+                    return_exceptions=True,
+                )
 
-                for filepath in batch:
+                for filepath, content_hash in zip(batch, hashes):
                     try:
-                        content = filepath.read_text(encoding="utf-8")
+                        if isinstance(content_hash, Exception):
+                            raise content_hash
                         filename = filepath.name
-                        content_hash = self.compute_hash(content)
 
                         # Check if file was already synced
-                        existing_syncs = await sync_log_repo.get_by_entity("content", filename)
+                        last_sync = latest_syncs.get(filename)
 
-                        if existing_syncs:
+                        if last_sync:
                             # File was synced before - skip to avoid duplicates
-                            last_sync = existing_syncs[0]  # Most recent sync
-
                             if last_sync.status == "success":
                                 # Check if content changed
                                 if last_sync.content_hash == content_hash:
@@ -282,45 +348,40 @@ class ContentUploader:
                                     logger.info(f"Skipping {filename} - already synced (content changed but cannot update)")
                                 skipped += 1
                                 continue  # Skip - file already exists
-                            else:
-                                # Previous sync failed, retry upload
-                                logger.info(f"Retrying {filename} - previous sync failed")
-                                file_id = await self.client.upload_file(content, filename)
-                                action = "create"
-
-                                if file_id:
-                                    await sync_log_repo.log_sync(
-                                        entity_type="content",
-                                        entity_id=filename,
-                                        action=action,
-                                        google_file_id=file_id,
-                                        content_hash=content_hash,
-                                    )
-                                    synced += 1
-                                else:
-                                    failed += 1
+
+                            # Previous sync failed, retry upload
+                            logger.info(f"Retrying {filename} - previous sync failed")
                         else:
-                            # New file - upload
                             logger.info(f"New file {filename}, uploading")
-                            file_id = await self.client.upload_file(content, filename)
-                            action = "create"
-
-                            if file_id:
-                                await sync_log_repo.log_sync(
-                                    entity_type="content",
-                                    entity_id=filename,
-                                    action=action,
-                                    google_file_id=file_id,
-                                    content_hash=content_hash,
-                                )
-                                synced += 1
-                            else:
-                                failed += 1
+
+                        pending.append((filepath, content_hash))
 
                     except Exception as e:
                         logger.error(f"Failed to sync content file {filepath}: {e}")
                         failed += 1
 
+                results = await asyncio.gather(
+                    *(self._upload_one(filepath) for filepath, _ in pending),
+                    return_exceptions=True,
+                )
+
+                for (filepath, content_hash), file_id in zip(pending, results):
+                    if isinstance(file_id, Exception):
+                        logger.error(f"Failed to sync content file {filepath}: {file_id}")
+                        failed += 1
+                    elif file_id:
+                        log_entries.append(dict(
+                            entity_type="content",
+                            entity_id=filepath.name,
+                            action="create",
+                            google_file_id=file_id,
+                            content_hash=content_hash,
+                        ))
+                        synced += 1
+                    else:
+                        failed += 1
+
+                await sync_log_repo.log_sync_many(log_entries)
                 await session.commit()
                 logger.info(
                     f"Batch complete: {synced} total synced, "
@@ -1,19 +1,202 @@
 """Google Gemini File Search API client."""
 
+import asyncio
+import functools
+import io
 import os
 import logging
-import tempfile
-import time
-from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
+import httpx
 from google import genai
+from google.genai import errors as genai_errors
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from ..utils.config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache()
+def get_genai_client(api_key: str) -> genai.Client:
+    """Get a shared genai client per API key, reusing its HTTP connections."""
+    return genai.Client(api_key=api_key)
+
+
+# (api_key, display name) -> resolved store name; failures are not cached
+_store_names: dict[tuple[str, str], str] = {}
+
+# Shared SDK configs; streams carry no filename, so uploads state their mime type
+_UPLOAD_CONFIG = {'mime_type': 'text/plain'}
+_FORCE_DELETE_CONFIG = {'force': True}
+
+# Errors worth retrying an animal sync for (server-side 5xx, dropped connections)
+_TRANSIENT_ERRORS = (genai_errors.ServerError, httpx.TransportError, TimeoutError)
+
+
+class ImportBatcher:
+    """Coalesce file search store operations and poll them together.
+
+    Operations queued within max_queue_time of each other (up to
+    max_batch_size) are started back-to-back and share one backoff polling
+    loop, instead of each upload polling its own operation.
+    """
+
+    def __init__(
+        self,
+        client: genai.Client,
+        store_name: str,
+        max_batch_size: int = 50,
+        max_queue_time: float = 0.5,
+        max_wait: float = 30.0,
+        idle_timeout: float = 5.0,
+    ):
+        self._client = client
+        self._store_name = store_name
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self.max_wait = max_wait
+        self.idle_timeout = idle_timeout
+        self._queue: asyncio.Queue[tuple[str, Callable[[], Any], asyncio.Future]] = asyncio.Queue()
+        self._collector: Optional[asyncio.Task] = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def process(self, file_name: str) -> bool:
+        """Import an uploaded file; True once its import operation is done."""
+        start = functools.partial(
+            self._client.file_search_stores.import_file,
+            file_search_store_name=self._store_name,
+            file_name=file_name,
+        )
+        try:
+            return await self._submit(file_name, start) is not None
+        except Exception:
+            # Already logged by the batch; the uploaded file is still usable
+            return False
+
+    async def upload(self, content: bytes, display_name: str) -> Any:
+        """Upload bytes straight into the store; returns the finished operation or None.
+
+        Raises the SDK error if the upload could not be started, so callers
+        can tell transient failures apart.
+        """
+        start = functools.partial(
+            self._client.file_search_stores.upload_to_file_search_store,
+            file_search_store_name=self._store_name,
+            file=io.BytesIO(content),
+            config={**_UPLOAD_CONFIG, 'display_name': display_name},
+        )
+        return await self._submit(display_name, start)
+
+    async def _submit(self, label: str, start: Callable[[], Any]) -> Any:
+        """Queue a blocking operation starter; resolves to the done operation or None.
+
+        Raises the starter's exception if the operation could not be started.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((label, start, future))
+        if self._collector is None or self._collector.done():
+            self._collector = asyncio.create_task(self._collect())
+        return await future
+
+    async def _collect(self) -> None:
+        """Group queued operations into batches; exit once idle."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                async with asyncio.timeout(self.idle_timeout):
+                    batch = [await self._queue.get()]
+            except TimeoutError:
+                if self._queue.empty():
+                    return
+                continue
+
+            deadline = loop.time() + self.max_queue_time
+            while len(batch) < self.max_batch_size:
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        batch.append(await self._queue.get())
+                except TimeoutError:
+                    break
+
+            # Keep collecting while this batch is being polled
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: list[tuple[str, Callable[[], Any], asyncio.Future]]) -> None:
+        try:
+            await self._process_batch(batch)
+        finally:
+            # Never leave an upload waiting, even if processing failed
+            for _, _, future in batch:
+                _resolve(future, None)
+
+    async def _process_batch(
+        self, batch: list[tuple[str, Callable[[], Any], asyncio.Future]]
+    ) -> None:
+        """Start every operation in the batch, then poll them all in one loop."""
+        operations = await asyncio.gather(
+            *(asyncio.to_thread(start) for _, start, _ in batch),
+            return_exceptions=True,
+        )
+
+        pending = []
+        for (label, _, future), operation in zip(batch, operations):
+            if isinstance(operation, Exception):
+                logger.warning(f"Failed to add {label} to search store: {operation}")
+                _fail(future, operation)
+            else:
+                pending.append((label, future, operation))
+
+        # Exponential backoff polling shared by the whole batch
+        waited = 0.0
+        delay = 0.25
+        while True:
+            for label, future, operation in pending:
+                if operation.done:
+                    error = getattr(operation, "error", None)
+                    if error:
+                        logger.warning(f"Search store operation failed for {label}: {error}")
+                    _resolve(future, None if error else operation)
+            pending = [entry for entry in pending if not entry[2].done]
+            if not pending or waited >= self.max_wait:
+                break
+            await asyncio.sleep(delay)
+            waited += delay
+            delay = min(delay * 2, 2.0)
+
+            refreshed = await asyncio.gather(
+                *(asyncio.to_thread(self._client.operations.get, op) for _, _, op in pending),
+                return_exceptions=True,
+            )
+            # Keep the previous handle if a poll fails; it is retried next round
+            pending = [
+                (label, future, previous if isinstance(op, Exception) else op)
+                for (label, future, previous), op in zip(pending, refreshed)
+            ]
+
+        for label, future, _ in pending:
+            logger.warning(f"Search store operation timed out: {label}")
+            _resolve(future, None)
+
+
+def _resolve(future: asyncio.Future, result: Any) -> None:
+    # The waiting upload may have been cancelled
+    if not future.done():
+        future.set_result(result)
+
+
+def _fail(future: asyncio.Future, error: BaseException) -> None:
+    if not future.done():
+        future.set_exception(error)
+
+
 class FileSearchClient:
     """Client for Google Gemini File Search API."""
 
@@ -26,15 +209,29 @@ class FileSearchClient:
         if not self.api_key:
             raise ValueError("Google API key is required")
 
-        # Configure the new genai client
-        self.client = genai.Client(api_key=self.api_key)
+        # Shared across instances so uploads reuse warm connections
+        self.client = get_genai_client(self.api_key)
         self.store_name = store_name
         self._files_cache: dict[str, str] = {}  # filename -> file_id
+        self._files_by_id: dict[str, str] = {}  # file_id -> filename
         self.file_search_store_name = None
         self._setup_file_search_store()
+        self.import_batcher: Optional[ImportBatcher] = None
+        if self.file_search_store_name:
+            self.import_batcher = ImportBatcher(
+                self.client,
+                self.file_search_store_name,
+                max_batch_size=get_settings().sync_batch_size,
+            )
 
     def _setup_file_search_store(self) -> None:
-        """Get or create file search store."""
+        """Get or create file search store (resolved once per process)."""
+        cache_key = (self.api_key, self.store_name)
+        cached = _store_names.get(cache_key)
+        if cached:
+            self.file_search_store_name = cached
+            return
+
         try:
             # List existing file search stores
             stores = list(self.client.file_search_stores.list())
@@ -42,7 +239,7 @@ class FileSearchClient:
             # Look for existing store
             for store in stores:
                 if hasattr(store, 'display_name') and store.display_name == self.store_name:
-                    self.file_search_store_name = store.name
+                    self.file_search_store_name = _store_names[cache_key] = store.name
                     logger.info(f"Using existing file search store: {self.file_search_store_name}")
                     return
 
@@ -51,75 +248,72 @@ class FileSearchClient:
             store = self.client.file_search_stores.create(
                 config={'display_name': self.store_name}
             )
-            self.file_search_store_name = store.name
+            self.file_search_store_name = _store_names[cache_key] = store.name
             logger.info(f"Created file search store: {self.file_search_store_name}")
         except Exception as e:
             logger.error(f"Failed to setup file search store: {e}")
             self.file_search_store_name = None
 
     async def upload_file(self, content: str, filename: str) -> str:
-        """Upload content as a file to Google and import into file search store."""
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".txt",
-            delete=False,
-            encoding="utf-8",
-        ) as f:
-            f.write(content)
-            temp_path = f.name
-
-        try:
-            # Upload to Google using new client API
-            # The 'file' parameter accepts a file path as a string
-            uploaded = self.client.files.upload(
-                file=temp_path,
-                config={'display_name': filename}
-            )
-            logger.info(f"Uploaded file: {filename} -> {uploaded.name}")
-
-            # Import file into file search store if available
-            if self.file_search_store_name:
-                try:
-                    operation = self.client.file_search_stores.import_file(
-                        file_search_store_name=self.file_search_store_name,
-                        file_name=uploaded.name
-                    )
-
-                    # Wait for import operation to complete (with timeout)
-                    max_wait = 30  # seconds
-                    wait_time = 0
-                    while not operation.done and wait_time < max_wait:
-                        time.sleep(2)
-                        wait_time += 2
-                        operation = self.client.operations.get(operation)
-
-                    if operation.done:
-                        logger.info(f"Imported file into search store: {filename}")
-                    else:
-                        logger.warning(f"File import timed out: {filename}")
-                except Exception as e:
-                    logger.warning(f"Failed to import file into search store: {e}")
-
-            # Cache the file ID
-            self._files_cache[filename] = uploaded.name
-
-            return uploaded.name
+        """Upload content into the file search store.
 
-        finally:
-            # Clean up temp file
-            Path(temp_path).unlink(missing_ok=True)
+        Returns the store document name when the SDK supports direct store
+        uploads, otherwise the Files API name of the imported file.
+        """
+        data = content.encode("utf-8")
+
+        # One call straight into the store, skipping the Files API resource
+        if self.import_batcher and hasattr(
+            self.client.file_search_stores, "upload_to_file_search_store"
+        ):
+            operation = await self.import_batcher.upload(data, filename)
+            document_name = getattr(getattr(operation, "response", None), "document_name", None)
+            if not document_name:
+                raise RuntimeError(f"Upload to file search store did not complete: {filename}")
+            logger.info(f"Uploaded into search store: {filename} -> {document_name}")
+            self._files_cache[filename] = document_name
+            self._files_by_id[document_name] = filename
+            return document_name
+
+        # Upload straight from memory; SDK calls are blocking, so they run in
+        # worker threads throughout
+        uploaded = await asyncio.to_thread(
+            self.client.files.upload,
+            file=io.BytesIO(data),
+            config={**_UPLOAD_CONFIG, 'display_name': filename},
+        )
+        logger.info(f"Uploaded file: {filename} -> {uploaded.name}")
+
+        # Import file into file search store if available; concurrent uploads
+        # share one import batch and polling loop
+        if self.import_batcher and await self.import_batcher.process(uploaded.name):
+            logger.info(f"Imported file into search store: {filename}")
+
+        # Cache the file ID
+        self._files_cache[filename] = uploaded.name
+        self._files_by_id[uploaded.name] = filename
+
+        return uploaded.name
 
     async def delete_file(self, file_id: str) -> bool:
-        """Delete a file from Google."""
+        """Delete a file or file search store document from Google."""
         try:
-            self.client.files.delete(name=file_id)
+            if file_id.startswith("fileSearchStores/"):
+                # Store documents hold indexed chunks; force removes them too
+                await asyncio.to_thread(
+                    self.client.file_search_stores.documents.delete,
+                    name=file_id,
+                    config=_FORCE_DELETE_CONFIG,
+                )
+            else:
+                await asyncio.to_thread(self.client.files.delete, name=file_id)
             logger.info(f"Deleted file: {file_id}")
 
             # Remove from cache
-            self._files_cache = {
-                k: v for k, v in self._files_cache.items() if v != file_id
-            }
+            filename = self._files_by_id.pop(file_id, None)
+            # The filename may already point at a newer upload
+            if filename is not None and self._files_cache.get(filename) == file_id:
+                del self._files_cache[filename]
 
             return True
         except Exception as e:
@@ -135,7 +329,8 @@ class FileSearchClient:
     async def list_files(self) -> list[dict]:
         """List all uploaded files."""
         files = []
-        files_response = self.client.files.list()
+        # The pager fetches further pages lazily, so drain it off the loop too
+        files_response = await asyncio.to_thread(lambda: list(self.client.files.list()))
         for f in files_response:
             files.append({
                 "name": f.name,
@@ -149,7 +344,7 @@ class FileSearchClient:
     async def get_file(self, file_id: str) -> Optional[dict]:
         """Get file information."""
         try:
-            f = self.client.files.get(name=file_id)
+            f = await asyncio.to_thread(self.client.files.get, name=file_id)
             return {
                 "name": f.name,
                 "display_name": getattr(f, "display_name", None),
@@ -182,57 +377,63 @@ class FileSearchClient:
 
     def format_animal_document(self, animal: dict) -> str:
         """Format animal data as a document for RAG."""
+        get = animal.get
+        name = get('name', 'Unknown')
+
         # Format images section
         images_section = ""
-        images_url = animal.get('images_url', [])
-        if images_url and isinstance(images_url, list) and len(images_url) > 0:
-            images_section = "\n## Images\n"
-            for idx, img_url in enumerate(images_url[:5], 1):  # Limit to first 5 images
-                images_section += f"- Image {idx}: {img_url}\n"
+        images_url = get('images_url', [])
+        if images_url and isinstance(images_url, list):
+            images_section = "\n## Images\n" + "".join(
+                f"- Image {idx}: {img_url}\n"
+                for idx, img_url in enumerate(images_url[:5], 1)  # Limit to first 5 images
+            )
 
-        return f"""# {animal.get('name', 'Unknown')} - {animal.get('species', 'Animal')} for Adoption
+        return f"""# {name} - {get('species', 'Animal')} for Adoption
 
 ## Basic Information
-- **Name:** {animal.get('name', 'Unknown')}
-- **Species:** {animal.get('species', 'Unknown')}
-- **Breed:** {animal.get('breed', 'Unknown')}
-- **Age:** {animal.get('age', 'Unknown')}
-- **Sex:** {animal.get('sex', 'Unknown')}
-- **Size:** {animal.get('size', 'Unknown')}
-- **Color:** {animal.get('color', 'Unknown')}
-- **Reference Number:** {animal.get('reference_number', 'Unknown')}
+- **Name:** {name}
+- **Species:** {get('species', 'Unknown')}
+- **Breed:** {get('breed', 'Unknown')}
+- **Age:** {get('age', 'Unknown')}
+- **Sex:** {get('sex', 'Unknown')}
+- **Size:** {get('size', 'Unknown')}
+- **Color:** {get('color', 'Unknown')}
+- **Reference Number:** {get('reference_number', 'Unknown')}
 {images_section}
 ## Description
-{animal.get('description', 'No description available.')}
+{get('description', 'No description available.')}
 
 ## Adoption Status
-This {animal.get('species', 'animal').lower()} is currently {animal.get('status', 'available')} for adoption at the SPCA Montreal.
+This {get('species', 'animal').lower()} is currently {get('status', 'available')} for adoption at the SPCA Montreal.
 
 ## How to Adopt
-To meet {animal.get('name', 'this animal')}, please visit the SPCA Montreal during opening hours.
+To meet {get('name', 'this animal')}, please visit the SPCA Montreal during opening hours.
 
 ## Profile Link
-View full profile: {animal.get('source_url', 'https://www.spca.com')}
+View full profile: {get('source_url', 'https://www.spca.com')}
 """
 
     async def sync_animal(self, animal: dict) -> Optional[str]:
-        """Sync a single animal to File Search."""
+        """Sync a single animal to File Search.
+
+        Transient API errors are retried with jittered backoff before the
+        animal is reported as failed.
+        """
         ref = animal.get("reference_number")
         if not ref:
             logger.error("Animal missing reference number")
             return None
 
-        filename = f"animal_{ref}.txt"
-        content = self.format_animal_document(animal)
-
-        existing_file_id = animal.get("google_file_id")
-
         try:
-            file_id = await self.upload_or_update(
-                content=content,
-                filename=filename,
-                existing_file_id=existing_file_id,
-            )
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(3),
+                wait=wait_random_exponential(multiplier=0.2, max=4),
+                retry=retry_if_exception_type(_TRANSIENT_ERRORS),
+                reraise=True,
+            ):
+                with attempt:
+                    file_id = await self._sync_animal_once(animal, ref)
             logger.info(f"Synced animal {ref} -> {file_id}")
             return file_id
 
@@ -240,6 +441,14 @@ View full profile: {animal.get('source_url', 'https://www.spca.com')}
             logger.error(f"Failed to sync animal {ref}: {e}")
             return None
 
+    async def _sync_animal_once(self, animal: dict, ref: str) -> str:
+        """Upload one animal document; errors propagate to the retry loop."""
+        return await self.upload_or_update(
+            content=self.format_animal_document(animal),
+            filename=f"animal_{ref}.txt",
+            existing_file_id=animal.get("google_file_id"),
+        )
+
     async def remove_animal(self, google_file_id: str) -> bool:
         """Remove an adopted animal from File Search."""
         return await self.delete_file(google_file_id)
@@ -1,7 +1,7 @@
 """Configuration management."""
 
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -44,6 +44,7 @@ class Settings(BaseSettings):
         default="spca_knowledge_base", alias="FILE_SEARCH_STORE_NAME"
     )
     sync_batch_size: int = Field(default=50, alias="SYNC_BATCH_SIZE")
+    sync_max_concurrent: int = Field(default=16, alias="SYNC_MAX_CONCURRENT")
 
     # API Server
     api_host: str = Field(default="0.0.0.0", alias="API_HOST")
@@ -67,9 +68,9 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         extra = "ignore"
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Get CORS origins as a list."""
+        """Get CORS origins as a list (parsed once per settings instance)."""
         if not self.cors_origins:
             return []
         return [origin.strip() for origin in self.cors_origins.split(",")]
@@ -0,0 +1,142 @@
+"""Tests for batched scrape-outcome writes."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.database.models import URLType
+from src.database.repositories.scrape_repository import ScrapedURLRepository
+from src.pipeline.batch_writer import BatchWriter
+
+
+def make_session() -> AsyncMock:
+    return AsyncMock()
+
+
+def ok(path: str = "file.txt") -> dict:
+    return {"success": True, "content_hash": "abc", "file_path": path}
+
+
+def failed(error: str = "boom") -> dict:
+    return {"success": False, "error": error}
+
+
+def compiled_sql(session: AsyncMock) -> str:
+    stmt = session.execute.await_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+async def test_flushes_when_batch_is_full():
+    session = make_session()
+    writer = BatchWriter(session, max_size=3, max_delay=3600)
+
+    await writer.record("https://a/1", URLType.GENERAL, ok())
+    await writer.record("https://a/2", URLType.GENERAL, ok())
+    session.execute.assert_not_awaited()
+
+    await writer.record("https://a/3", URLType.GENERAL, failed())
+    session.execute.assert_awaited_once()
+    session.commit.assert_awaited_once()
+    assert writer._pending == []
+
+
+async def test_flushes_when_batch_is_stale():
+    session = make_session()
+    writer = BatchWriter(session, max_size=100, max_delay=5.0)
+
+    await writer.record("https://a/1", URLType.GENERAL, ok())
+    session.execute.assert_not_awaited()
+
+    writer._last_flush -= 5.0
+    await writer.record("https://a/2", URLType.GENERAL, ok())
+    session.execute.assert_awaited_once()
+    session.commit.assert_awaited_once()
+    assert writer._pending == []
+
+
+async def test_flush_without_rows_skips_the_database():
+    session = make_session()
+    writer = BatchWriter(session)
+
+    await writer.flush()
+
+    session.execute.assert_not_awaited()
+    session.commit.assert_not_awaited()
+
+
+async def test_flush_error_rolls_back_requeues_and_raises():
+    session = make_session()
+    session.execute.side_effect = RuntimeError("db down")
+    writer = BatchWriter(session, max_size=100, max_delay=3600)
+    await writer.record("https://a/1", URLType.GENERAL, ok())
+    await writer.record("https://a/2", URLType.GENERAL, failed())
+
+    with pytest.raises(RuntimeError):
+        await writer.flush()
+
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_awaited()
+    assert [row["url"] for row in writer._pending] == ["https://a/1", "https://a/2"]
+
+    # The next flush retries the same rows, ahead of newer ones
+    session.execute.side_effect = None
+    await writer.record("https://a/3", URLType.GENERAL, ok())
+    await writer.flush()
+    assert writer._pending == []
+    session.commit.assert_awaited_once()
+
+
+async def test_record_keeps_rows_when_automatic_flush_fails():
+    session = make_session()
+    session.execute.side_effect = RuntimeError("db down")
+    writer = BatchWriter(session, max_size=2, max_delay=3600)
+
+    await writer.record("https://a/1", URLType.GENERAL, ok())
+    await writer.record("https://a/2", URLType.GENERAL, ok())
+
+    session.rollback.assert_awaited_once()
+    assert len(writer._pending) == 2
+
+
+async def test_record_results_keeps_latest_outcome_per_url():
+    session = make_session()
+    repo = ScrapedURLRepository(session)
+
+    await repo.record_results([
+        {"url": "https://a/1", "url_type": URLType.GENERAL, "success": False,
+         "error_message": "first"},
+        {"url": "https://a/2", "url_type": URLType.GENERAL, "success": True,
+         "content_hash": "h2", "file_path": "2.txt"},
+        {"url": "https://a/1", "url_type": URLType.GENERAL, "success": True,
+         "content_hash": "h1", "file_path": "1.txt"},
+    ])
+
+    stmt = session.execute.await_args.args[0]
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    urls = sorted(value for key, value in params.items() if key.startswith("url_m"))
+    assert urls == ["https://a/1", "https://a/2"]
+    assert "first" not in params.values()
+
+
+async def test_record_results_increments_retry_count_on_failure():
+    session = make_session()
+    repo = ScrapedURLRepository(session)
+
+    await repo.record_results([
+        {"url": "https://a/1", "url_type": URLType.GENERAL, "success": False,
+         "error_message": "boom"},
+    ])
+
+    sql = compiled_sql(session)
+    assert "ON CONFLICT (url) DO UPDATE" in sql
+    assert "retry_count = CASE" in sql
+    assert "scraped_urls.retry_count +" in sql
+
+
+async def test_record_results_without_rows_skips_the_database():
+    session = make_session()
+
+    await ScrapedURLRepository(session).record_results([])
+
+    session.execute.assert_not_awaited()
@@ -0,0 +1,113 @@
+"""Tests for the queued event publisher."""
+
+import asyncio
+
+from src.pipeline.events import Event, EventEmitter, EventPublisher, EventType
+
+
+def recording_emitter() -> tuple[EventEmitter, list[Event]]:
+    emitter = EventEmitter()
+    received: list[Event] = []
+
+    async def handler(event: Event) -> None:
+        received.append(event)
+
+    emitter.on_any(handler)
+    return emitter, received
+
+
+async def test_publish_does_not_wait_for_delivery():
+    emitter, received = recording_emitter()
+    publisher = EventPublisher(emitter)
+
+    publisher.publish(EventType.ANIMAL_UPDATED, {"reference": "1"})
+
+    assert received == []
+    await publisher.aclose()
+    assert [event.data for event in received] == [{"reference": "1"}]
+
+
+async def test_flush_delivers_events_in_publish_order():
+    emitter, received = recording_emitter()
+    publisher = EventPublisher(emitter)
+
+    for n in range(250):
+        publisher.publish(EventType.CONTENT_SAVED, {"n": n})
+    await publisher.flush()
+
+    assert [event.data["n"] for event in received] == list(range(250))
+    await publisher.aclose()
+
+
+async def test_drain_batches_up_to_max_batch():
+    emitter = EventEmitter()
+    batches: list[int] = []
+    emit_many = emitter.emit_many
+
+    async def record_batch(events: list[Event]) -> None:
+        batches.append(len(events))
+        await emit_many(events)
+
+    emitter.emit_many = record_batch
+    publisher = EventPublisher(emitter, max_batch=10)
+
+    for n in range(25):
+        publisher.publish(EventType.ANIMAL_UPDATED, {"n": n})
+    await publisher.flush()
+
+    assert batches == [10, 10, 5]
+    await publisher.aclose()
+
+
+async def test_failing_handler_does_not_stop_delivery():
+    emitter, received = recording_emitter()
+
+    async def broken(event: Event) -> None:
+        raise RuntimeError("boom")
+
+    emitter.on(EventType.ANIMAL_ADOPTED, broken)
+    publisher = EventPublisher(emitter)
+
+    publisher.publish(EventType.ANIMAL_ADOPTED, {"reference": "1"})
+    publisher.publish(EventType.ANIMAL_UPDATED, {"reference": "2"})
+    await publisher.flush()
+
+    assert [event.type for event in received] == [
+        EventType.ANIMAL_ADOPTED,
+        EventType.ANIMAL_UPDATED,
+    ]
+    await publisher.aclose()
+
+
+async def test_aclose_stops_the_task_and_publisher_restarts():
+    emitter, received = recording_emitter()
+    publisher = EventPublisher(emitter)
+
+    publisher.publish(EventType.ANIMAL_UPDATED)
+    task = publisher._task
+    await publisher.aclose()
+
+    assert task.done()
+    assert publisher._task is None
+    assert len(received) == 1
+
+    # Publishing after close starts a fresh background task
+    publisher.publish(EventType.ANIMAL_UPDATED)
+    await publisher.aclose()
+    assert len(received) == 2
+
+
+async def test_aclose_without_events_is_a_no_op():
+    await EventPublisher(EventEmitter()).aclose()
+
+
+async def test_aclose_after_task_was_cancelled():
+    emitter, _ = recording_emitter()
+    publisher = EventPublisher(emitter)
+    publisher.publish(EventType.ANIMAL_UPDATED)
+
+    publisher._task.cancel()
+    await asyncio.sleep(0)
+    await asyncio.wait_for(publisher.aclose(), timeout=1)
+
+    assert publisher._task is None
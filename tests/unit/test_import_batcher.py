@@ -0,0 +1,123 @@
+"""Tests for batched file search store operations."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.sync.file_search_client import ImportBatcher
+
+
+class FakeOperations:
+    """Operations that finish after a number of polls."""
+
+    def __init__(self, polls_until_done: int = 1, error: str | None = None):
+        self.polls_until_done = polls_until_done
+        self.error = error
+        self.polls: dict[str, int] = {}
+
+    def start(self, name: str) -> SimpleNamespace:
+        self.polls[name] = 0
+        return SimpleNamespace(name=name, done=False, error=None)
+
+    def get(self, operation: SimpleNamespace) -> SimpleNamespace:
+        self.polls[operation.name] += 1
+        done = self.polls[operation.name] >= self.polls_until_done
+        return SimpleNamespace(
+            name=operation.name,
+            done=done,
+            error=self.error if done else None,
+            response=SimpleNamespace(document_name=f"doc/{operation.name}"),
+        )
+
+
+def make_client(operations: FakeOperations, fail_start: Exception | None = None):
+    def import_file(file_search_store_name: str, file_name: str):
+        if fail_start is not None:
+            raise fail_start
+        return operations.start(file_name)
+
+    def upload_to_file_search_store(file_search_store_name: str, file, config: dict):
+        if fail_start is not None:
+            raise fail_start
+        return operations.start(config["display_name"])
+
+    return SimpleNamespace(
+        file_search_stores=SimpleNamespace(
+            import_file=import_file,
+            upload_to_file_search_store=upload_to_file_search_store,
+        ),
+        operations=operations,
+    )
+
+
+def make_batcher(client, **kwargs) -> ImportBatcher:
+    kwargs.setdefault("max_queue_time", 0.05)
+    kwargs.setdefault("idle_timeout", 0.1)
+    return ImportBatcher(client, "fileSearchStores/test", **kwargs)
+
+
+def record_batches(batcher: ImportBatcher) -> list[int]:
+    sizes: list[int] = []
+    process_batch = batcher._process_batch
+
+    async def wrapped(batch):
+        sizes.append(len(batch))
+        await process_batch(batch)
+
+    batcher._process_batch = wrapped
+    return sizes
+
+
+async def test_concurrent_imports_share_batches():
+    batcher = make_batcher(make_client(FakeOperations()), max_batch_size=3)
+    sizes = record_batches(batcher)
+
+    results = await asyncio.gather(*(batcher.process(f"files/{n}") for n in range(7)))
+
+    assert results == [True] * 7
+    assert sizes == [3, 3, 1]
+
+
+async def test_upload_returns_finished_operation():
+    batcher = make_batcher(make_client(FakeOperations(polls_until_done=2)))
+
+    operation = await batcher.upload(b"content", "animal_1.txt")
+
+    assert operation.done
+    assert operation.response.document_name == "doc/animal_1.txt"
+
+
+async def test_failed_operation_resolves_to_none():
+    batcher = make_batcher(make_client(FakeOperations(error="quota")))
+
+    assert await batcher.process("files/1") is False
+    assert await batcher.upload(b"content", "animal_1.txt") is None
+
+
+async def test_start_error_is_raised_from_upload():
+    error = ConnectionError("reset")
+    batcher = make_batcher(make_client(FakeOperations(), fail_start=error))
+
+    with pytest.raises(ConnectionError):
+        await batcher.upload(b"content", "animal_1.txt")
+    assert await batcher.process("files/1") is False
+
+
+async def test_unfinished_operation_times_out():
+    operations = FakeOperations(polls_until_done=1000)
+    batcher = make_batcher(make_client(operations), max_wait=0.3)
+
+    assert await batcher.process("files/1") is False
+    assert operations.polls["files/1"] >= 1
+
+
+async def test_collector_exits_when_idle_and_restarts():
+    batcher = make_batcher(make_client(FakeOperations()))
+
+    assert await batcher.process("files/1") is True
+    collector = batcher._collector
+    await asyncio.wait_for(collector, timeout=1)
+
+    assert await batcher.process("files/2") is True
+    assert batcher._collector is not collector
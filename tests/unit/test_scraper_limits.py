@@ -0,0 +1,141 @@
+"""Tests for the scrapers' rate and concurrency limiters."""
+
+import asyncio
+
+import pytest
+
+from src.scrapers.base import AdaptiveSemaphore, RateLimiter
+
+
+async def settle() -> None:
+    """Let every runnable task advance until it blocks again."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.parametrize(
+    ("initial", "expected"),
+    [(None, 4), (1, 4), (16, 16), (128, 128), (1000, 128)],
+)
+def test_adaptive_semaphore_initial_limit_is_clamped(initial, expected):
+    assert AdaptiveSemaphore(initial=initial).limit == expected
+
+
+def test_adaptive_semaphore_grows_additively_up_to_max():
+    sem = AdaptiveSemaphore(initial=126)
+
+    sem.record_success()
+    assert sem.limit == 127
+    sem.record_success()
+    sem.record_success()
+    assert sem.limit == 128
+
+
+def test_adaptive_semaphore_halves_down_to_min():
+    sem = AdaptiveSemaphore(initial=100)
+
+    sem.record_failure()
+    assert sem.limit == 50
+    sem.record_failure()
+    sem.record_failure()
+    assert sem.limit == 12
+    sem.record_failure()
+    sem.record_failure()
+    assert sem.limit == 4
+
+
+async def test_adaptive_semaphore_blocks_at_limit():
+    sem = AdaptiveSemaphore(initial=4)
+    for _ in range(4):
+        await sem.acquire()
+
+    waiter = asyncio.create_task(sem.acquire())
+    await settle()
+    assert not waiter.done()
+
+    await sem.release()
+    await settle()
+    assert waiter.done()
+    assert sem._in_flight == 4
+
+
+async def test_adaptive_semaphore_release_wakes_waiters_after_growth():
+    sem = AdaptiveSemaphore(initial=4)
+    for _ in range(4):
+        await sem.acquire()
+    waiters = [asyncio.create_task(sem.acquire()) for _ in range(3)]
+    await settle()
+
+    sem.record_success()
+    sem.record_success()
+    await sem.release()
+    await settle()
+
+    # Limit 6 with 3 in flight: one release admits all three waiters
+    assert all(waiter.done() for waiter in waiters)
+    assert sem._in_flight == 6
+
+
+async def test_adaptive_semaphore_shrink_holds_waiters_until_below_limit():
+    sem = AdaptiveSemaphore(initial=8)
+    for _ in range(8):
+        await sem.acquire()
+    waiter = asyncio.create_task(sem.acquire())
+    await settle()
+
+    sem.record_failure()
+    assert sem.limit == 4
+    for _ in range(4):
+        await sem.release()
+        await settle()
+        assert not waiter.done()
+
+    await sem.release()
+    await settle()
+    assert waiter.done()
+    assert sem._in_flight == 4
+
+
+async def test_adaptive_semaphore_context_manager_releases_on_error():
+    sem = AdaptiveSemaphore()
+
+    with pytest.raises(RuntimeError):
+        async with sem:
+            assert sem._in_flight == 1
+            raise RuntimeError("boom")
+
+    assert sem._in_flight == 0
+
+
+async def test_rate_limiter_spaces_concurrent_acquires():
+    interval = 0.02
+    limiter = RateLimiter(requests_per_second=1 / interval, burst=3)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def timed_acquire() -> float:
+        await limiter.acquire()
+        return loop.time() - start
+
+    elapsed = sorted(await asyncio.gather(*(timed_acquire() for _ in range(8))))
+
+    # The first `burst` go out at once, then one per interval
+    tolerance = 0.005
+    assert elapsed[2] < interval
+    for n in range(3, 8):
+        assert elapsed[n] >= (n - 2) * interval - tolerance
+    assert elapsed[-1] < 5 * interval + 0.5
+
+
+async def test_rate_limiter_reserves_slots_without_waiting_for_sleepers():
+    limiter = RateLimiter(requests_per_second=1.0, burst=1)
+
+    await limiter.acquire()
+    waiters = [asyncio.create_task(limiter.acquire()) for _ in range(3)]
+    await settle()
+
+    # Each caller reserved its own slot before sleeping
+    assert limiter._next_slot - asyncio.get_running_loop().time() == pytest.approx(4.0, abs=0.1)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
@@ -0,0 +1,132 @@
+"""Tests for URL categorization."""
+
+import pytest
+
+from src.database.models import URLType
+from src.scrapers.url_categorizer import URLCategorizer
+
+BASE = "https://www.spca.com"
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        # Sections, with and without a trailing slash
+        ("/en/animal/rex-dog-12345/", URLType.ANIMAL),
+        ("/fr/animal/rex-chien-12345/", URLType.ANIMAL),
+        ("/en/animal/rex-dog-12345", URLType.ANIMAL),
+        ("/en/adoption/cats-for-adoption/", URLType.ADOPTION_LIST),
+        ("/fr/adoption/chats-a-adopter/", URLType.ADOPTION_LIST),
+        ("/en/services/", URLType.SERVICE),
+        ("/en/services", URLType.SERVICE),
+        ("/fr/services/clinique/", URLType.SERVICE),
+        ("/en/tips-and-advice/winter/", URLType.TIPS),
+        ("/fr/conseils/hiver/", URLType.TIPS),
+        # Section matches only as the first two path segments
+        ("/en/news/animal/rex-12345/", URLType.GENERAL),
+        ("/fr/tips-and-advice/", URLType.GENERAL),
+        ("/en/conseils/", URLType.GENERAL),
+        # Slug patterns
+        ("/en/animal/", URLType.GENERAL),
+        ("/en/animal/rex/", URLType.GENERAL),
+        ("/en/adoption/", URLType.GENERAL),
+        ("/en/adoption/dogs/", URLType.GENERAL),
+        ("/fr/adoption/dogs-for-adoption/", URLType.GENERAL),
+        ("/en/adoption/chiens-a-adopter/", URLType.GENERAL),
+        # General content
+        ("/", URLType.GENERAL),
+        ("/en/", URLType.GENERAL),
+        ("/en/about-us/", URLType.GENERAL),
+    ],
+)
+def test_categorize_sections(path, expected):
+    assert URLCategorizer.categorize(BASE + path).url_type == expected
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        # Extensions are read from the path, ignoring case and query strings
+        "/en/report.pdf",
+        "/en/report.PDF",
+        "/en/report.pdf?a=1",
+        "/en/photo.jpeg",
+        "/en/photo.png",
+        "/en/clip.mp4",
+        "/en/form.docx",
+        "/en/budget.xlsx",
+        # Non-content directories anywhere above the last segment
+        "/wp-content/uploads/photo",
+        "/wp-admin/",
+        "/en/calendar/2024/",
+        "/en/feed/",
+        "/en/cart/",
+        "/en/checkout/",
+        "/en/my-account/orders/",
+    ],
+)
+def test_categorize_ignored(path):
+    categorized = URLCategorizer.categorize(BASE + path)
+    assert categorized.url_type == URLType.IGNORED
+    assert categorized.priority == URLCategorizer.PRIORITIES[URLType.IGNORED]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        # Section URLs win over the ignore rules
+        "/en/animal/rex-dog-12345/",
+        # Ignored names must be a whole directory, not a prefix or the last segment
+        "/en/feedback/",
+        "/en/calendar",
+        "/en/pdf-guides/",
+    ],
+)
+def test_categorize_not_ignored(path):
+    assert URLCategorizer.categorize(BASE + path).url_type != URLType.IGNORED
+
+
+@pytest.mark.parametrize(
+    ("path", "language"),
+    [
+        ("/en/animal/rex-dog-12345/", "en"),
+        ("/fr/animal/rex-chien-12345/", "fr"),
+        ("/FR/animal/rex-chien-12345/", "fr"),
+        ("/fr", "fr"),
+        ("/", "en"),
+        ("/about/", "en"),
+        # Only the first path segment counts
+        ("/en/news/fr/", "en"),
+        ("/en/page?lang=/fr/", "en"),
+        ("/french/", "en"),
+    ],
+)
+def test_categorize_language(path, language):
+    assert URLCategorizer.categorize(BASE + path).language == language
+
+
+def test_priorities_follow_url_type():
+    urls = [
+        BASE + "/en/about-us/",
+        BASE + "/en/tips-and-advice/winter/",
+        BASE + "/en/report.pdf",
+        BASE + "/en/services/",
+        BASE + "/en/adoption/cats-for-adoption/",
+        BASE + "/en/animal/rex-dog-12345/",
+    ]
+
+    scrapable = URLCategorizer.filter_scrapable(urls)
+
+    assert [c.url_type for c in scrapable] == [
+        URLType.ANIMAL,
+        URLType.ADOPTION_LIST,
+        URLType.SERVICE,
+        URLType.TIPS,
+        URLType.GENERAL,
+    ]
+    assert all(c.priority == URLCategorizer.PRIORITIES[c.url_type] for c in scrapable)
+
+
+def test_extract_reference_number():
+    assert URLCategorizer.extract_reference_number(BASE + "/en/animal/rex-dog-12345/") == "12345"
+    assert URLCategorizer.extract_reference_number(BASE + "/en/services/") is None